@@ -1,19 +1,37 @@
 from __future__ import annotations
 
 import argparse
-import json
+import logging
+import os
+import sys
+from collections.abc import Iterator
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from focus_scrub.handlers import HandlerConfig, get_column_handlers_for_dataset, list_datasets
-from focus_scrub.io import (
+# Only light modules are imported here so that --help and argument errors return
+# without loading pandas/pyarrow; the processing modules are imported in main().
+from focus_scrub.datasets import list_datasets
+from focus_scrub.formats import (
+    DEFAULT_BATCH_SIZE,
+    PARQUET_COMPRESSIONS,
     FileFormat,
-    discover_focus_files,
-    output_path_for_file,
-    read_focus_file,
-    write_focus_file,
+    ParquetOptions,
 )
-from focus_scrub.mapping import MappingCollector, MappingEngine
-from focus_scrub.scrub import DataFrameScrub
+
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+    from focus_scrub.io import FocusFileWriter
+    from focus_scrub.scrub import DataFrameScrub
+
+
+logger = logging.getLogger("focus_scrub")
+
+# The dataset table is static; list it once for the parser's choices.
+_DATASETS = tuple(list_datasets())
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -34,7 +52,7 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--dataset",
         required=True,
-        choices=list_datasets(),
+        choices=_DATASETS,
         help="Dataset name to select the correct column scrub handlers.",
     )
     parser.add_argument(
@@ -55,14 +73,14 @@ def build_parser() -> argparse.ArgumentParser:
         type=Path,
         default=None,
         metavar="PATH",
-        help="Optional path to write a JSON file with all handler mappings after processing.",
+        help="Optional path to write a JSON file with all handler mappings after processing (msgpack if the path ends in .msgpack).",
     )
     parser.add_argument(
         "--load-mappings",
         type=Path,
         default=None,
         metavar="PATH",
-        help="Optional path to load mappings from a previous run to ensure consistent scrubbing.",
+        help="Optional path to load mappings from a previous run to ensure consistent scrubbing (JSON, or msgpack if the path ends in .msgpack).",
     )
     parser.add_argument(
         "--remove-custom-columns",
@@ -92,13 +110,159 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Custom table name for SQL output. If not provided, derives from filename.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Overlap reading, scrubbing and writing of files when greater than 1, writing up to N files at a time; 0 uses one writer per CPU (default: 1).",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Read, scrub and write each file in batches of --chunk-size rows to bound memory use (parquet and csv-gzip output only).",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        metavar="ROWS",
+        help=f"Rows per batch when using --stream (default: {DEFAULT_BATCH_SIZE}).",
+    )
+    parser.add_argument(
+        "--row-group-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        metavar="ROWS",
+        help=f"Maximum rows per row group in parquet output (default: {DEFAULT_BATCH_SIZE}).",
+    )
+    parser.add_argument(
+        "--compression",
+        choices=PARQUET_COMPRESSIONS,
+        default="zstd",
+        help="Compression codec for parquet output (default: zstd).",
+    )
+    parser.add_argument(
+        "--skip-existing",
+        action="store_true",
+        help="Skip input files whose output already exists and is newer than the input. Skipped files add nothing to --export-mappings.",
+    )
     return parser
 
 
+def _is_up_to_date(input_file: Path, destination: Path) -> bool:
+    """Return True if *destination* exists and was modified after *input_file*.
+
+    Outputs only appear once fully written (see io._atomic_output), so an existing
+    destination is a completed one.
+    """
+    try:
+        return destination.stat().st_mtime >= input_file.stat().st_mtime
+    except FileNotFoundError:
+        return False
+
+
+def _write_output(
+    input_file: Path,
+    scrubbed: pd.DataFrame,
+    *,
+    writer: FocusFileWriter,
+    destinations: dict[Path, Path],
+    sql_table_name: str | None,
+) -> Path:
+    """Write the scrubbed frame for *input_file* and return its destination path."""
+    destination = destinations[input_file]
+    writer(scrubbed, destination, sql_table_name)
+    return destination
+
+
+def _write_table_output(
+    input_file: Path,
+    scrubbed: pa.Table,
+    *,
+    destinations: dict[Path, Path],
+    parquet_options: ParquetOptions,
+) -> Path:
+    """Write the scrubbed Arrow table for *input_file* as Parquet and return its path."""
+    from focus_scrub.io import write_focus_table
+
+    destination = destinations[input_file]
+    write_focus_table(
+        scrubbed,
+        destination,
+        FileFormat.PARQUET,
+        ensure_parent=False,
+        parquet_options=parquet_options,
+    )
+    return destination
+
+
+def _stream_output(
+    input_file: Path,
+    *,
+    scrub: DataFrameScrub,
+    chunk_size: int,
+    destinations: dict[Path, Path],
+    output_format: FileFormat,
+    parquet_options: ParquetOptions,
+) -> Path:
+    """Scrub *input_file* batch by batch into its destination and return that path."""
+    from focus_scrub.io import read_focus_file_batches, write_focus_file_batches
+
+    destination = destinations[input_file]
+    batches = read_focus_file_batches(input_file, batch_size=chunk_size)
+    write_focus_file_batches(
+        (scrub.scrub(batch) for batch in batches),
+        destination,
+        output_format,
+        ensure_parent=False,
+        parquet_options=parquet_options,
+    )
+    return destination
+
+
 def main() -> int:
     parser = build_parser()
     args = parser.parse_args()
 
+    # Progress lines go through one handler bound to the current stdout, which is
+    # block-buffered when redirected, instead of a print() per file.
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    # Keep the lines out of any root handlers an embedding application configured,
+    # so each is written once, as print() did; restore the logger afterwards.
+    previous_level, previous_propagate = logger.level, logger.propagate
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    try:
+        return _run(parser, args)
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(previous_level)
+        logger.propagate = previous_propagate
+        handler.flush()
+
+
+def _run(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    from focus_scrub.handlers import HandlerConfig, get_column_handlers_for_dataset
+    from focus_scrub.io import (
+        discover_focus_files,
+        get_focus_file_writer,
+        output_path_for_file,
+        read_focus_file,
+        read_focus_table,
+    )
+    from focus_scrub.mapping import (
+        MappingCollector,
+        MappingEngine,
+        check_mappings_path,
+        read_mappings_file,
+        write_mappings_file,
+    )
+    from focus_scrub.pipeline import run_pipeline
+    from focus_scrub.scrub import DataFrameScrub
+
     input_path: Path = args.input_path
     output_path: Path = args.output_path
     dataset: str = args.dataset
@@ -111,11 +275,69 @@ def main() -> int:
     scrub_tag_keys: bool = args.scrub_tag_keys
     dates_only: bool = args.dates_only
     sql_table_name: str | None = args.sql_table_name
+    jobs: int = args.jobs
+    stream: bool = args.stream
+    chunk_size: int = args.chunk_size
+    skip_existing: bool = args.skip_existing
+    parquet_options = ParquetOptions(
+        compression=args.compression, row_group_size=args.row_group_size
+    )
+
+    if jobs < 0:
+        parser.error("--jobs must be 0 (auto) or a positive number.")
+    if chunk_size < 1:
+        parser.error("--chunk-size must be at least 1.")
+    if parquet_options.row_group_size < 1:
+        parser.error("--row-group-size must be at least 1.")
+    if stream and output_format == FileFormat.SQL:
+        parser.error("--stream does not support sql output.")
+    if stream and jobs > 1:
+        parser.error("--stream cannot be combined with --jobs.")
+    if jobs == 0:
+        # Streaming processes one file at a time, so auto mode stays sequential there
+        jobs = 1 if stream else os.cpu_count() or 1
+    # Fail before processing, not at export time, if a mappings format is unavailable
+    for mappings_path in (load_mappings, export_mappings):
+        if mappings_path is not None:
+            try:
+                check_mappings_path(mappings_path)
+            except ValueError as exc:
+                parser.error(str(exc))
 
     files = discover_focus_files(input_path)
     if not files:
         parser.error("No supported input files found (.csv, .csv.gz, .parquet).")
 
+    # The same file can be reached more than once through symlinks; scrub it once
+    unique_files: dict[Path, Path] = {}
+    for input_file in files:
+        unique_files.setdefault(input_file.resolve(), input_file)
+    files = list(unique_files.values())
+
+    destinations = {
+        input_file: output_path_for_file(
+            input_file=input_file,
+            input_root=input_path,
+            output_root=output_path,
+            output_format=output_format,
+        )
+        for input_file in files
+    }
+
+    if skip_existing:
+        pending = []
+        for input_file in files:
+            if _is_up_to_date(input_file, destinations[input_file]):
+                logger.info("Skipped (up to date): %s", input_file)
+            else:
+                pending.append(input_file)
+        files = pending
+
+    if jobs > 1:
+        # Start the largest files first so a big file picked up last does not leave
+        # the other writers idle while it finishes.
+        files.sort(key=lambda path: path.stat().st_size, reverse=True)
+
     collector = MappingCollector() if export_mappings is not None else None
     handler_config = HandlerConfig(
         date_shift_days=date_shift_days, scrub_tag_keys=scrub_tag_keys, dates_only=dates_only
@@ -126,51 +348,108 @@ def main() -> int:
     if load_mappings is not None:
         if not load_mappings.exists():
             parser.error(f"Mapping file not found: {load_mappings}")
-        mapping_data = json.loads(load_mappings.read_text())
+        mapping_data = read_mappings_file(load_mappings)
         mapping_engine = MappingEngine()
         if "component_mappings" in mapping_data:
-            mapping_engine.load_mappings(mapping_data["component_mappings"])
-            print(f"Loaded mappings from: {load_mappings}")
+            # mapping_data is not used again, so the engine can adopt its dicts
+            mapping_engine.load_bulk(mapping_data["component_mappings"])
+            logger.info("Loaded mappings from: %s", load_mappings)
 
     column_handlers, mapping_engine = get_column_handlers_for_dataset(
         dataset, config=handler_config, collector=collector, mapping_engine=mapping_engine
     )
+    # Handlers (and their compiled patterns and mapping state) are built once here
+    # and reused for every file; never rebuild them per file.
     scrub = DataFrameScrub(
         column_handlers=column_handlers,
         remove_custom_columns=remove_custom_columns,
         drop_columns=drop_columns,
     )
 
-    for input_file in files:
-        df = read_focus_file(input_file)
-        scrubbed = scrub.scrub(df)
-        destination = output_path_for_file(
-            input_file=input_file,
-            input_root=input_path,
-            output_root=output_path,
+    # Create each output directory once up front rather than once per written file
+    for directory in {destination.parent for destination in destinations.values()}:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    results: Iterator[tuple[Path, Path]]
+    if stream:
+        stream_output = partial(
+            _stream_output,
+            scrub=scrub,
+            chunk_size=chunk_size,
+            destinations=destinations,
             output_format=output_format,
+            parquet_options=parquet_options,
+        )
+        results = ((input_file, stream_output(input_file)) for input_file in files)
+    elif output_format == FileFormat.PARQUET:
+        # Parquet output stays in Arrow end to end; only handled columns are
+        # converted to pandas for scrubbing.
+        write_table = partial(
+            _write_table_output, destinations=destinations, parquet_options=parquet_options
+        )
+        if jobs == 1 or len(files) == 1:
+            results = (
+                (
+                    input_file,
+                    write_table(input_file, scrub.scrub_table(read_focus_table(input_file))),
+                )
+                for input_file in files
+            )
+        else:
+            # Overlap reading, scrubbing and writing of consecutive files
+            results = run_pipeline(
+                files,
+                read=read_focus_table,
+                scrub=scrub.scrub_table,
+                write=write_table,
+                writers=jobs,
+            )
+    else:
+        write = partial(
+            _write_output,
+            # The output format is fixed for the run; resolve its writer once
+            writer=get_focus_file_writer(output_format),
+            destinations=destinations,
+            sql_table_name=sql_table_name,
         )
-        write_focus_file(scrubbed, destination, output_format, sql_table_name=sql_table_name)
-        print(f"Processed: {input_file} -> {destination}")
+        if jobs == 1 or len(files) == 1:
+            results = (
+                (input_file, write(input_file, scrub.scrub(read_focus_file(input_file))))
+                for input_file in files
+            )
+        else:
+            results = run_pipeline(
+                files, read=read_focus_file, scrub=scrub.scrub, write=write, writers=jobs
+            )
 
-    print(f"Done. Processed {len(files)} file(s) for dataset '{dataset}'.")
+    try:
+        for input_file, destination in results:
+            logger.info("Processed: %s -> %s", input_file, destination)
+    except ValueError as exc:
+        # e.g. a streamed CSV whose column types change past the schema probe
+        parser.error(str(exc))
+
+    logger.info("Done. Processed %d file(s) for dataset '%s'.", len(files), dataset)
 
     if export_mappings is not None:
+        component_mappings = mapping_engine.get_all_mappings()
+        column_mappings = collector.to_dict() if collector is not None else {}
+
+        # Nothing was mapped (e.g. --dates-only or empty inputs): skip the export
+        if not column_mappings and not any(component_mappings.values()):
+            logger.info("No mappings to export.")
+            return 0
+
         export_mappings.parent.mkdir(parents=True, exist_ok=True)
 
         # Build export data with both column mappings and component mappings
         export_data = {
-            "column_mappings": {},
-            "component_mappings": mapping_engine.get_all_mappings(),
+            "column_mappings": column_mappings,
+            "component_mappings": component_mappings,
         }
 
-        if collector is not None:
-            export_data["column_mappings"] = {
-                col: dict(pairs) for col, pairs in collector.to_dict().items()
-            }
-
-        export_mappings.write_text(json.dumps(export_data, indent=2))
-        print(f"Mappings written to: {export_mappings}")
+        write_mappings_file(export_mappings, export_data)
+        logger.info("Mappings written to: %s", export_mappings)
 
     return 0
 
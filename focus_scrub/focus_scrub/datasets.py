@@ -0,0 +1,52 @@
+"""Dataset definitions: which handler scrubs each column of a FOCUS dataset.
+
+This module has no heavy dependencies so the CLI can list datasets without
+importing pandas.
+"""
+
+from __future__ import annotations
+
+
+# Dataset-specific column mapping.
+#
+# Map dataset name -> (column name -> handler name).
+DATASET_COLUMN_HANDLER_NAMES: dict[str, dict[str, str]] = {
+    "CostAndUsage": {
+        "BillingPeriodStart": "DateReformat",
+        "BillingPeriodEnd": "DateReformat",
+        "ChargePeriodStart": "DateReformat",
+        "ChargePeriodEnd": "DateReformat",
+        "BillingAccountId": "AccountId",
+        "BillingAccountName": "StellarName",
+        "SubAccountId": "AccountId",
+        "SubAccountName": "StellarName",
+        "CommitmentDiscountId": "CommitmentDiscountId",
+        "ResourceId": "ResourceId",
+        "Tags": "Tags",
+        "oci_ReferenceNumber": "unmapped_scamble_string",
+        "oci_CompartmentId": "ResourceId",
+        "oci_CompartmentName": "StellarName",
+        "x_BillingAccountName": "StellarName",
+        "x_BillingAccountId": "AccountId",
+        "x_BillingProfileId": "AccountId",
+        "x_CustomerName": "StellarName",
+        "x_InvoiceSectionId": "AccountId",
+        "x_ResourceGroupName": "StellarName",
+    },
+    "ContractCommitment": {
+        "ContractCommitmentPeriodStart": "DateReformat",
+        "ContractCommitmentPeriodEnd": "DateReformat",
+        "ContractPeriodStart": "DateReformat",
+        "ContractPeriodEnd": "DateReformat",
+        "BillingAccountId": "AccountId",
+        "BillingAccountName": "StellarName",
+        "SubAccountId": "AccountId",
+        "SubAccountName": "StellarName",
+        "CommitmentDiscountId": "CommitmentDiscountId",
+        "Tags": "Tags",
+    },
+}
+
+
+def list_datasets() -> list[str]:
+    return sorted(DATASET_COLUMN_HANDLER_NAMES.keys())
@@ -0,0 +1,44 @@
+"""File format constants shared by the CLI and the I/O layer.
+
+This module has no heavy dependencies so the CLI can build its parser without
+importing pandas or pyarrow.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+
+
+class FileFormat(str, Enum):
+    CSV_GZIP = "csv-gzip"
+    PARQUET = "parquet"
+    SQL = "sql"
+
+
+SUPPORTED_INPUT_EXTENSIONS: tuple[str, ...] = (".csv", ".csv.gz", ".parquet")
+
+# Rows per batch when streaming files, and per row group in Parquet output (128Ki rows).
+DEFAULT_BATCH_SIZE = 128 * 1024
+
+# Codecs accepted by --compression for Parquet output.
+PARQUET_COMPRESSIONS: tuple[str, ...] = ("zstd", "snappy", "gzip", "none")
+
+
+@dataclass(frozen=True)
+class ParquetOptions:
+    """Encoding settings for Parquet output.
+
+    zstd at a low level compresses FOCUS string columns better than snappy at
+    similar speed, so it is the default.
+    """
+
+    compression: str = "zstd"
+    row_group_size: int = DEFAULT_BATCH_SIZE
+
+    def writer_kwargs(self) -> dict[str, object]:
+        """Return keyword arguments for ``pq.write_table``/``pq.ParquetWriter``."""
+        kwargs: dict[str, object] = {"compression": self.compression, "use_dictionary": True}
+        if self.compression == "zstd":
+            kwargs["compression_level"] = 3
+        return kwargs
@@ -1,24 +1,103 @@
 from __future__ import annotations
 
+import ast
 import hashlib
+import json
 import re
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cache
 from typing import Protocol
 
+import numpy as np
 import pandas as pd
 
+from focus_scrub.datasets import DATASET_COLUMN_HANDLER_NAMES, list_datasets
 from focus_scrub.mapping import MappingCollector, MappingEngine
 
 
+# orjson is optional; it parses Azure/OCI tag JSON several times faster than json.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
 class ColumnHandler(Protocol):
     def scrub(self, value: object) -> object: ...
 
+    def scrub_series(self, series: pd.Series) -> pd.Series: ...
+
     def attach_collector(self, column_name: str, collector: MappingCollector) -> None: ...
 
 
-@dataclass
+def _is_na(value: object) -> bool:
+    """Return True for the scalar null values pd.isna recognizes, without calling it."""
+    if value is None or value is pd.NA or value is pd.NaT:
+        return True
+    if isinstance(value, float | np.floating):
+        return value != value
+    if isinstance(value, np.datetime64 | np.timedelta64):
+        return bool(np.isnat(value))
+    return False
+
+
+def _as_str(value: object) -> str:
+    """Return *value* as a str, skipping the str() call for values that already are."""
+    return value if type(value) is str else str(value)
+
+
+def _scrub_present(
+    series: pd.Series, scrub_values: Callable[[np.ndarray], Iterable[object]]
+) -> pd.Series:
+    """Scrub the non-null values of *series* in one call, leaving nulls in place.
+
+    *scrub_values* receives the non-null values as an object array and returns one
+    result per value, in order. The result is typed the way ``series.map`` would type it.
+    """
+    na_mask = series.isna().to_numpy()
+    if na_mask.all():
+        # Nothing to scrub; keep the dtype instead of inferring one from the nulls
+        return series
+    values = series.to_numpy(dtype=object, copy=True)
+    present = values[~na_mask]
+    results = scrub_values(present)
+    if not isinstance(results, np.ndarray):
+        # fromiter keeps list/tuple results (e.g. tags) as single elements
+        results = np.fromiter(results, dtype=object, count=len(present))
+    values[~na_mask] = results
+    return pd.Series(values, index=series.index, name=series.name).infer_objects()
+
+
+# infer_dtype kinds whose equal values also have equal string forms
+_SINGLE_KIND_DTYPES = frozenset({"string", "integer", "floating", "boolean", "empty"})
+
+
+def _scrub_unique(values: np.ndarray, scrub: Callable[[object], object]) -> np.ndarray:
+    """Call *scrub* once per distinct value, in first-appearance order, and broadcast.
+
+    Values of different types are kept apart even when they compare equal, since
+    factorize would otherwise treat ``1``, ``1.0`` and ``True`` as one value.
+    """
+    single_kind = pd.api.types.infer_dtype(values, skipna=False) in _SINGLE_KIND_DTYPES
+    try:
+        if single_kind:
+            codes, uniques = pd.factorize(values)
+        else:
+            keys = np.fromiter(
+                ((type(value), value) for value in values), dtype=object, count=len(values)
+            )
+            codes, typed_uniques = pd.factorize(keys)
+            uniques = [value for _, value in typed_uniques]
+    except TypeError:
+        # Unhashable values (lists, dicts) cannot be deduplicated
+        return np.fromiter(map(scrub, values), dtype=object, count=len(values))
+    results = np.fromiter(map(scrub, uniques), dtype=object, count=len(uniques))
+    return results[codes]
+
+
+@dataclass(slots=True)
 class GeneratorMappingHandler:
     generator_factory: Callable[[], Iterator[str]]
     value_map: dict[str, str] = field(default_factory=dict)
@@ -31,15 +110,12 @@ class GeneratorMappingHandler:
         self._collector = collector
 
     def scrub(self, value: object) -> object:
-        # Handle scalar NA values
-        try:
-            if pd.isna(value):
-                return value
-        except (ValueError, TypeError):
-            # Non-scalar or incompatible type, continue processing
-            pass
+        if _is_na(value):
+            return value
+        return self._scrub_one(value)
 
-        normalized = str(value)
+    def _scrub_one(self, value: object) -> object:
+        normalized = _as_str(value)
         if normalized not in self.value_map:
             if self._generator is None:
                 self._generator = self.generator_factory()
@@ -49,8 +125,20 @@ class GeneratorMappingHandler:
 
         return self.value_map[normalized]
 
+    def scrub_series(self, series: pd.Series) -> pd.Series:
+        if isinstance(series.dtype, pd.StringDtype):
+            # Already in the string form value_map is keyed by
+            return _scrub_present(series, lambda values: _scrub_unique(values, self._scrub_one))
+        return _scrub_present(series, self._scrub_values)
+
+    def _scrub_values(self, values: np.ndarray) -> np.ndarray:
+        # Values are keyed by their string form, so dedupe on that; the generator is
+        # only advanced for strings not seen before, in first-appearance order.
+        normalized = np.fromiter(map(str, values), dtype=object, count=len(values))
+        return _scrub_unique(normalized, self._scrub_one)
+
 
-@dataclass
+@dataclass(slots=True)
 class DateReformatHandler:
     days_to_add: int = 0
     _column_name: str = field(default="", init=False, repr=False)
@@ -61,16 +149,13 @@ class DateReformatHandler:
         self._collector = collector
 
     def scrub(self, value: object) -> object:
-        # Handle scalar NA values
-        try:
-            if pd.isna(value):
-                return value
-        except (ValueError, TypeError):
-            # Non-scalar or incompatible type, continue processing
-            pass
+        if _is_na(value):
+            return value
+        return self._scrub_one(value)
 
+    def _scrub_one(self, value: object) -> object:
         parsed = pd.to_datetime(value, errors="coerce")
-        if pd.isna(parsed):
+        if parsed is pd.NaT:
             return value
 
         shifted = parsed + pd.Timedelta(days=self.days_to_add)
@@ -87,6 +172,29 @@ class DateReformatHandler:
 
         return result
 
+    def scrub_series(self, series: pd.Series) -> pd.Series:
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            return self._shift_timestamps(series)
+        # Date columns repeat heavily; parse and shift each distinct value once
+        return _scrub_present(series, lambda values: _scrub_unique(values, self._scrub_one))
+
+    def _shift_timestamps(self, series: pd.Series) -> pd.Series:
+        """Shift an already-parsed datetime column with one vectorized add.
+
+        Per value, timestamps come back as datetime objects, so the result is cast to
+        their microsecond resolution to match scrub. NaT stays NaT.
+        """
+        shift = pd.Timedelta(days=self.days_to_add)
+        shifted = (series + shift).dt.as_unit("us")
+        if self._collector is not None and self.days_to_add != 0:
+            originals = series.dropna().unique()
+            results = (originals + shift).as_unit("us")
+            self._collector.record_many(
+                self._column_name,
+                zip(map(str, originals), map(str, results), strict=True),
+            )
+        return shifted
+
 
 # ---------------------------------------------------------------------------
 # Account ID handler
@@ -98,80 +206,150 @@ _UUID_RE = re.compile(
     re.IGNORECASE,
 )
 
+_UUID_LENGTH = 36
+
+# True when every character of the given string is a hex digit.
+_is_hex = frozenset("0123456789abcdefABCDEF").issuperset
+
+
+def _is_uuid_at(value: str, start: int) -> bool:
+    """Return True if an 8-4-4-4-12 UUID begins at *start* in *value*."""
+    return (
+        len(value) - start >= _UUID_LENGTH
+        and value[start + 8] == "-"
+        and value[start + 13] == "-"
+        and value[start + 18] == "-"
+        and value[start + 23] == "-"
+        and _is_hex(value[start : start + 8])
+        and _is_hex(value[start + 9 : start + 13])
+        and _is_hex(value[start + 14 : start + 18])
+        and _is_hex(value[start + 19 : start + 23])
+        and _is_hex(value[start + 24 : start + _UUID_LENGTH])
+    )
+
+
+def _find_uuids(value: str) -> list[tuple[int, int]]:
+    """Return the ``(start, end)`` spans of the UUIDs in *value*, as _UUID_RE.finditer would.
+
+    Only positions eight characters before a dash can start a UUID, so the scan hops
+    between dashes with str.find instead of stepping through every character.
+    """
+    spans = []
+    dash = value.find("-", 8)
+    while dash != -1:
+        start = dash - 8
+        if _is_uuid_at(value, start):
+            spans.append((start, start + _UUID_LENGTH))
+            # The next UUID's first dash is at least 8 characters past this one's end
+            dash = value.find("-", start + _UUID_LENGTH + 8)
+        elif len(value) - start <= _UUID_LENGTH:
+            break
+        else:
+            dash = value.find("-", dash + 1)
+    return spans
+
+
+def _replace_spans(value: str, spans: list[tuple[int, int]], replace: Callable[[str], str]) -> str:
+    """Rebuild *value* with each span's text passed through *replace*."""
+    pieces = []
+    pos = 0
+    for start, end in spans:
+        pieces.append(value[pos:start])
+        pieces.append(replace(value[start:end]))
+        pos = end
+    pieces.append(value[pos:])
+    return "".join(pieces)
+
+
 # Matches dash-separated alphanumeric codes like JW5R-JYGR-BG7-PGB
 # (typically 4 segments of 3-4 chars each, uppercase alphanumeric)
 _PROFILE_CODE_RE = re.compile(
     r"\b[A-Z0-9]{3,4}(?:-[A-Z0-9]{3,4}){2,}\b",
 )
 
+# The shortest possible profile code: three 3-character segments and two dashes
+_MIN_PROFILE_CODE_LENGTH = 11
+
 # Matches 12-digit account IDs
 _12DIGIT_ACCOUNT_ID_RE = re.compile(r"\b\d{12}\b")
 
+# All three component patterns in one alternation, so a value is scanned once.
+# UUIDs come first so that a 12-digit final UUID segment is not taken for an
+# account ID; only the UUID branch is case-insensitive.
+_ACCOUNT_COMPONENT_RE = re.compile(
+    f"(?P<uuid>(?i:{_UUID_RE.pattern}))"
+    f"|(?P<profile_code>{_PROFILE_CODE_RE.pattern})"
+    f"|(?P<account_id>{_12DIGIT_ACCOUNT_ID_RE.pattern})"
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class AccountIdHandler:
     """Scrubs account IDs using a shared mapping engine for consistency."""
 
     mapping_engine: MappingEngine
     _column_name: str = field(default="", init=False, repr=False)
     _collector: MappingCollector | None = field(default=None, init=False, repr=False)
+    # Original -> replacement; values are recorded to the collector on first sight only
+    _result_cache: dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    # re.sub callback for _ACCOUNT_COMPONENT_RE matches, built once per handler
+    _replace_component: Callable[[re.Match[str]], str] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Resolve the engine's map methods once instead of on every match
+        mappers: dict[str | None, Callable[[str], str]] = {
+            "uuid": self.mapping_engine.map_uuid,
+            "profile_code": self.mapping_engine.map_profile_code,
+            "account_id": self.mapping_engine.map_number_id,
+        }
+        self._replace_component = lambda match: mappers[match.lastgroup](match.group(0))
 
     def attach_collector(self, column_name: str, collector: MappingCollector) -> None:
         self._column_name = column_name
         self._collector = collector
+        # Cached values were recorded to the previous collector, if any
+        self._result_cache.clear()
 
     def scrub(self, value: object) -> object:
-        # Handle scalar NA values
-        try:
-            if pd.isna(value):
-                return value
-        except (ValueError, TypeError):
-            # Non-scalar or incompatible type, continue processing
-            pass
+        if _is_na(value):
+            return value
+        return self._scrub_one(value)
+
+    def _scrub_one(self, value: object) -> object:
+        original = _as_str(value).strip()
+        replacement = self._result_cache.get(original)
+        if replacement is not None:
+            return replacement
 
-        original = str(value).strip()
         replacement = self._scrub_value(original)
+        self._result_cache[original] = replacement
 
         if self._collector is not None:
             self._collector.record(self._column_name, original, replacement)
 
         return replacement
 
+    def scrub_series(self, series: pd.Series) -> pd.Series:
+        # Billing columns hold few distinct accounts; scrub each one once
+        return _scrub_present(series, lambda values: _scrub_unique(values, self._scrub_one))
+
     def _scrub_value(self, value: str) -> str:
         """Scrub a value by delegating to the mapping engine."""
         # Pure numeric: use NumberId mapping
         if value.isdigit():
             return self.mapping_engine.map_number_id(value)
 
-        # Contains UUIDs, profile codes, or account IDs: map each component consistently
-        if (
-            _UUID_RE.search(value)
-            or _PROFILE_CODE_RE.search(value)
-            or _12DIGIT_ACCOUNT_ID_RE.search(value)
-        ):
-            result = value
-
-            # Map all 12-digit account IDs
-            def replace_account_id(match: re.Match[str]) -> str:
-                account_id = match.group(0)
-                return self.mapping_engine.map_number_id(account_id)
-
-            result = _12DIGIT_ACCOUNT_ID_RE.sub(replace_account_id, result)
-
-            # Map all UUIDs
-            def replace_uuid(match: re.Match[str]) -> str:
-                uuid_str = match.group(0)
-                return self.mapping_engine.map_uuid(uuid_str)
-
-            result = _UUID_RE.sub(replace_uuid, result)
-
-            # Map all profile codes
-            def replace_profile_code(match: re.Match[str]) -> str:
-                code = match.group(0)
-                return self.mapping_engine.map_profile_code(code)
-
-            result = _PROFILE_CODE_RE.sub(replace_profile_code, result)
+        # Too short to hold any component: skip the regex scan. Account IDs need 12
+        # characters and profile codes 11, dashes included.
+        length = len(value)
+        if length < _MIN_PROFILE_CODE_LENGTH or (length < 12 and "-" not in value):
+            return self.mapping_engine.map_uuid(value)
 
+        # Contains UUIDs, profile codes, or account IDs: map each component consistently
+        result, count = _ACCOUNT_COMPONENT_RE.subn(self._replace_component, value)
+        if count:
             return result
 
         # Fallback: opaque string → UUID
@@ -183,63 +361,58 @@ class AccountIdHandler:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class StellarNameHandler:
     """Maps arbitrary account names to stellar-themed generated names."""
 
     mapping_engine: MappingEngine
     _column_name: str = field(default="", init=False, repr=False)
     _collector: MappingCollector | None = field(default=None, init=False, repr=False)
+    # Original -> replacement; values are recorded to the collector on first sight only
+    _result_cache: dict[str, str] = field(default_factory=dict, init=False, repr=False)
 
     def attach_collector(self, column_name: str, collector: MappingCollector) -> None:
         self._column_name = column_name
         self._collector = collector
+        # Cached values were recorded to the previous collector, if any
+        self._result_cache.clear()
 
     def scrub(self, value: object) -> object:
-        # Handle scalar NA values
-        try:
-            if pd.isna(value):
-                return value
-        except (ValueError, TypeError):
-            # Non-scalar or incompatible type, continue processing
-            pass
+        if _is_na(value):
+            return value
+        return self._scrub_one(value)
+
+    def _scrub_one(self, value: object) -> object:
+        original = _as_str(value).strip()
+        replacement = self._result_cache.get(original)
+        if replacement is not None:
+            return replacement
 
-        original = str(value).strip()
         replacement = self.mapping_engine.map_name(original)
+        self._result_cache[original] = replacement
 
         if self._collector is not None:
             self._collector.record(self._column_name, original, replacement)
 
         return replacement
 
+    def scrub_series(self, series: pd.Series) -> pd.Series:
+        # Names repeat on every row of an account; map each distinct name once
+        return _scrub_present(series, lambda values: _scrub_unique(values, self._scrub_one))
+
 
 # ---------------------------------------------------------------------------
 # Commitment Discount ID handler
 # ---------------------------------------------------------------------------
 
 
-@dataclass
-class CommitmentDiscountIdHandler:
-    """Scrubs commitment discount IDs by delegating to AccountIdHandler."""
-
-    mapping_engine: MappingEngine
-    _account_id_handler: AccountIdHandler = field(init=False, repr=False)
-    _column_name: str = field(default="", init=False, repr=False)
-    _collector: MappingCollector | None = field(default=None, init=False, repr=False)
-
-    def __post_init__(self) -> None:
-        # Create an AccountIdHandler with the shared mapping engine
-        self._account_id_handler = AccountIdHandler(mapping_engine=self.mapping_engine)
-
-    def attach_collector(self, column_name: str, collector: MappingCollector) -> None:
-        self._column_name = column_name
-        self._collector = collector
-        # Pass through to the underlying handler with the same column name
-        self._account_id_handler.attach_collector(column_name, collector)
+@dataclass(slots=True)
+class CommitmentDiscountIdHandler(AccountIdHandler):
+    """Scrubs commitment discount IDs exactly like AccountIdHandler.
 
-    def scrub(self, value: object) -> object:
-        # Delegate to AccountIdHandler
-        return self._account_id_handler.scrub(value)
+    A subclass rather than a wrapper, so each value is scrubbed without an extra
+    delegating call, while the handler keeps its own name for future divergence.
+    """
 
 
 # ---------------------------------------------------------------------------
@@ -247,77 +420,88 @@ class CommitmentDiscountIdHandler:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+# Recognizes the resource ID format from its leading characters; the name of the
+# matching group selects the scrubber.
+_RESOURCE_ID_FORMAT_RE = re.compile(
+    r"(?P<ocid>ocid1\.)"
+    r"|(?P<oci_service>oci_)"
+    r"|(?P<azure>/subscriptions/)"
+    r"|(?P<arn>arn:)"
+    r"|(?P<aws_prefixed>(?:i|eni|nat|sg|subnet|vpc|vol)-)"
+)
+
+
+# The first segment of an ARN resource ("resource-type" or "resource-name") is
+# preserved when it is one of these common AWS resource types.
+_AWS_RESOURCE_TYPES = frozenset(
+    {
+        "loadbalancer",
+        "log-group",
+        "task",
+        "cluster",
+        "natgateway",
+        "hostedzone",
+        "table",
+        "function",
+        "distribution",
+        "stream",
+        "security-group",
+        "network-interface",
+        "volume",
+        "snapshot",
+    }
+)
+
+# Load balancer scheme types in ARN resources, preserved wherever they appear
+_LOAD_BALANCER_SCHEMES = frozenset({"net", "app"})
+
+# Azure Resource ID structure keywords, each followed by its value segment
+_AZURE_KEYWORDS = frozenset({"subscriptions", "resourcegroups", "providers"})
+
+
+@dataclass(slots=True)
 class ResourceIdHandler:
     """Scrubs resource IDs with pattern matching and character-level scrambling."""
 
     mapping_engine: MappingEngine
-    _char_map: dict[str, str] = field(default_factory=dict, init=False, repr=False)
     _column_name: str = field(default="", init=False, repr=False)
     _collector: MappingCollector | None = field(default=None, init=False, repr=False)
-
-    # Regex patterns for specific resource types
-    _ARN_PATTERN = re.compile(r"^arn:aws:[^:]+:[^:]*:(\d{12}):")
-    _UUID_PATTERN = re.compile(
-        r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.I
-    )
-    _ACCOUNT_ID_PATTERN = re.compile(r"\d{12}")
+    # Original -> replacement; values are recorded to the collector on first sight only
+    _result_cache: dict[str, str] = field(default_factory=dict, init=False, repr=False)
 
     def attach_collector(self, column_name: str, collector: MappingCollector) -> None:
         self._column_name = column_name
         self._collector = collector
-
-    def _get_char_mapping(self, char: str) -> str:
-        """Get or create a random character mapping."""
-        if char not in self._char_map:
-            import random
-            import string
-
-            # Map to same character class
-            if char.isupper():
-                self._char_map[char] = random.choice(string.ascii_uppercase)
-            elif char.islower():
-                self._char_map[char] = random.choice(string.ascii_lowercase)
-            elif char.isdigit():
-                self._char_map[char] = random.choice(string.digits)
-            else:
-                # Non-alphanumeric characters stay the same
-                self._char_map[char] = char
-
-        return self._char_map[char]
-
-    def _scramble_string(self, value: str) -> str:
-        """Scramble a string by mapping each alphanumeric character."""
-        return "".join(self._get_char_mapping(c) for c in value)
+        # Cached values were recorded to the previous collector, if any
+        self._result_cache.clear()
 
     def _scrub_arn(self, value: str) -> str:
         """Handle ARN format by scrubbing embedded account IDs, UUIDs, and resource names."""
         # ARN format: arn:partition:service:region:account-id:resource-type/resource-id
         # or: arn:partition:service:region:account-id:resource-id
 
-        parts = value.split(":")
+        # The resource may itself contain ':', so split off only the five fixed fields
+        parts = value.split(":", 5)
         if len(parts) < 6:
             # Not a valid ARN, just scramble the whole thing
-            return self._scramble_string(value)
+            return self.mapping_engine.scramble(value)
 
-        # Parts: [arn, partition, service, region, account-id, resource...]
+        # Parts: [arn, partition, service, region, account-id, resource]
         # Keep the first 4 parts (arn:partition:service:region) unchanged
         prefix_parts = parts[:4]
-        account_part = parts[4] if len(parts) > 4 else ""
-        resource_parts = parts[5:] if len(parts) > 5 else []
+        account_part = parts[4]
+        resource_string = parts[5]
 
         # Replace account ID if present
         if account_part and account_part.isdigit() and len(account_part) == 12:
             account_part = self.mapping_engine.map_number_id(account_part)
 
-        # Join resource parts back (they were split by ':')
-        resource_string = ":".join(resource_parts) if resource_parts else ""
-
         # Replace UUIDs in the resource string
-        for match in self._UUID_PATTERN.finditer(resource_string):
-            uuid_val = match.group(0)
-            replacement = self.mapping_engine.map_uuid(uuid_val)
-            resource_string = resource_string.replace(uuid_val, replacement)
+        uuid_spans = _find_uuids(resource_string)
+        if uuid_spans:
+            resource_string = _replace_spans(
+                resource_string, uuid_spans, self.mapping_engine.map_uuid
+            )
 
         # Scramble resource names and IDs
         # The first segment before "/" is often resource-type (e.g., "loadbalancer", "log-group")
@@ -326,36 +510,17 @@ class ResourceIdHandler:
             # Split by / for hierarchical resources
             slash_parts = resource_string.split("/")
 
-            # First part might be "resource-type" or "resource-name"
-            # Common AWS resource types to preserve
-            aws_resource_types = {
-                "loadbalancer",
-                "log-group",
-                "task",
-                "cluster",
-                "natgateway",
-                "hostedzone",
-                "table",
-                "function",
-                "distribution",
-                "stream",
-                "security-group",
-                "network-interface",
-                "volume",
-                "snapshot",
-            }
-
             scrambled_slash_parts = []
             for i, part in enumerate(slash_parts):
                 # First segment: preserve if it's a known resource type, otherwise scramble
-                if i == 0 and part in aws_resource_types:
+                if i == 0 and part in _AWS_RESOURCE_TYPES:
                     scrambled_slash_parts.append(part)
                 # "net" and "app" are load balancer scheme types, preserve them
-                elif part in ["net", "app"]:
+                elif part in _LOAD_BALANCER_SCHEMES:
                     scrambled_slash_parts.append(part)
                 else:
                     # Scramble everything else (resource names and IDs)
-                    scrambled_slash_parts.append(self._scramble_string(part))
+                    scrambled_slash_parts.append(self.mapping_engine.scramble(part))
 
             resource_string = "/".join(scrambled_slash_parts)
 
@@ -375,63 +540,50 @@ class ResourceIdHandler:
         parts = value.split("/")
         if len(parts) < 3:
             # Not a valid Azure Resource ID
-            return self._scramble_string(value)
+            return self.mapping_engine.scramble(value)
 
         scrubbed_parts = []
-        i = 0
-        while i < len(parts):
-            part = parts[i]
+        # Keywords consume the segment after them; pair each segment with its successor
+        skip_next = False
+        for part, next_part in zip(parts, [*parts[1:], None], strict=True):
+            if skip_next:
+                skip_next = False
+                continue
 
             # Empty string at start (before first /)
             if not part:
                 scrubbed_parts.append(part)
-                i += 1
-                continue
-
             # Preserve Azure structure keywords
-            if part in ["subscriptions", "resourcegroups", "providers"]:
+            elif part in _AZURE_KEYWORDS:
                 scrubbed_parts.append(part)
-                # Next part is the value - check if it's a subscription ID (UUID)
-                if i + 1 < len(parts):
-                    next_part = parts[i + 1]
-                    if part == "subscriptions" and self._UUID_PATTERN.match(next_part):
-                        # Scramble subscription ID (UUID)
-                        scrubbed_parts.append(self.mapping_engine.map_uuid(next_part))
-                        i += 2
-                        continue
-                    elif part in ["resourcegroups", "providers"]:
-                        # Next part after resourcegroups/providers needs special handling
-                        if part == "resourcegroups":
-                            # Resource group name - scramble it
-                            scrubbed_parts.append(self._scramble_string(next_part))
-                            i += 2
-                            continue
-                        else:
-                            # Provider namespace like "microsoft.compute" - preserve
-                            scrubbed_parts.append(next_part)
-                            i += 2
-                            continue
-                i += 1
+                # The next part is the keyword's value
+                if next_part is None:
+                    continue
+                if part == "resourcegroups":
+                    # Resource group name - scramble it
+                    scrubbed_parts.append(self.mapping_engine.scramble(next_part))
+                    skip_next = True
+                elif part == "providers":
+                    # Provider namespace like "microsoft.compute" - preserve
+                    scrubbed_parts.append(next_part)
+                    skip_next = True
+                elif _is_uuid_at(next_part, 0):
+                    # Scramble subscription ID (UUID)
+                    scrubbed_parts.append(self.mapping_engine.map_uuid(next_part))
+                    skip_next = True
+                # Otherwise the next part is handled as an ordinary segment
             # Preserve Microsoft provider namespaces
             elif part.startswith("microsoft."):
                 scrubbed_parts.append(part)
-                i += 1
             # Check if it's a UUID embedded in a resource name
-            elif self._UUID_PATTERN.search(part):
+            elif uuid_spans := _find_uuids(part):
                 # Replace UUIDs within the string
-                scrubbed_part = part
-                for match in self._UUID_PATTERN.finditer(part):
-                    uuid_val = match.group(0)
-                    replacement = self.mapping_engine.map_uuid(uuid_val)
-                    scrubbed_part = scrubbed_part.replace(uuid_val, replacement)
-                # Scramble the non-UUID parts
-                # Split by UUID pattern and scramble text segments
-                scrubbed_parts.append(scrubbed_part)
-                i += 1
+                scrubbed_parts.append(
+                    _replace_spans(part, uuid_spans, self.mapping_engine.map_uuid)
+                )
             else:
                 # Resource type or resource name - scramble it
-                scrubbed_parts.append(self._scramble_string(part))
-                i += 1
+                scrubbed_parts.append(self.mapping_engine.scramble(part))
 
         return "/".join(scrubbed_parts)
 
@@ -446,17 +598,17 @@ class ResourceIdHandler:
             # Just scramble the service name part after oci_
             parts = value.split("_", 1)
             if len(parts) == 2:
-                return f"oci_{self._scramble_string(parts[1])}"
+                return f"oci_{self.mapping_engine.scramble(parts[1])}"
             return value
 
         # Handle full OCIDs: ocid1.{resource_type}.{realm}.{region}.{unique_id}
         if not value.startswith("ocid1."):
-            return self._scramble_string(value)
+            return self.mapping_engine.scramble(value)
 
         parts = value.split(".")
         if len(parts) < 5:
             # Not a valid OCID, scramble it
-            return self._scramble_string(value)
+            return self.mapping_engine.scramble(value)
 
         # Parts: [ocid1, resource_type, realm, region, unique_id]
         # Keep ocid1, realm (oc1), and region structure
@@ -468,54 +620,98 @@ class ResourceIdHandler:
         unique_id = ".".join(parts[4:])  # The unique identifier (may contain dots)
 
         # Scramble resource type and unique ID
-        scrambled_resource_type = self._scramble_string(resource_type)
-        scrambled_unique_id = self._scramble_string(unique_id)
+        scrambled_resource_type = self.mapping_engine.scramble(resource_type)
+        scrambled_unique_id = self.mapping_engine.scramble(unique_id)
 
         return f"{ocid_prefix}.{scrambled_resource_type}.{realm}.{region}.{scrambled_unique_id}"
 
     def scrub(self, value: object) -> object:
-        # Handle scalar NA values
-        try:
-            if pd.isna(value):
-                return value
-        except (ValueError, TypeError):
-            # Non-scalar or incompatible type, continue processing
-            pass
+        if _is_na(value):
+            return value
+        return self._scrub_one(value)
 
-        original = str(value).strip()
+    def _scrub_one(self, value: object) -> object:
+        original = _as_str(value).strip()
+        replacement = self._result_cache.get(original)
+        if replacement is not None:
+            return replacement
 
-        # Handle OCI OCIDs
-        if original.startswith("ocid1.") or (original.startswith("oci_") and "." not in original):
-            replacement = self._scrub_oci_resource_id(original)
-        # Handle Azure Resource IDs
-        elif original.startswith("/subscriptions/"):
-            replacement = self._scrub_azure_resource_id(original)
-        # Handle AWS ARNs
-        elif original.startswith("arn:"):
-            replacement = self._scrub_arn(original)
-        # Handle instance IDs, ENI IDs, NAT gateway IDs, etc.
-        elif original.startswith(("i-", "eni-", "nat-", "sg-", "subnet-", "vpc-", "vol-")):
-            # Keep the prefix, scramble the rest
-            prefix_end = original.find("-") + 1
-            prefix = original[:prefix_end]
-            suffix = original[prefix_end:]
-            replacement = prefix + self._scramble_string(suffix)
-        else:
-            # Default: scramble the entire value
-            replacement = self._scramble_string(original)
+        replacement = self._scrub_value(original)
+        self._result_cache[original] = replacement
 
         if self._collector is not None:
             self._collector.record(self._column_name, original, replacement)
 
         return replacement
 
+    def scrub_series(self, series: pd.Series) -> pd.Series:
+        # Resources repeat across usage rows; scrub each distinct ID once
+        return _scrub_present(series, lambda values: _scrub_unique(values, self._scrub_one))
+
+    def _scrub_value(self, value: str) -> str:
+        """Scrub a resource ID according to the cloud provider format it starts with."""
+        match = _RESOURCE_ID_FORMAT_RE.match(value)
+        kind = match.lastgroup if match else None
+        # Handle OCI OCIDs and simple OCI service names
+        if kind == "ocid" or (kind == "oci_service" and "." not in value):
+            return self._scrub_oci_resource_id(value)
+        # Handle Azure Resource IDs
+        if kind == "azure":
+            return self._scrub_azure_resource_id(value)
+        # Handle AWS ARNs
+        if kind == "arn":
+            return self._scrub_arn(value)
+        # Handle instance IDs, ENI IDs, NAT gateway IDs, etc.
+        if kind == "aws_prefixed" and match:
+            # Keep the prefix, scramble the rest
+            prefix_end = match.end()
+            return value[:prefix_end] + self.mapping_engine.scramble(value[prefix_end:])
+        # Default: scramble the entire value
+        return self.mapping_engine.scramble(value)
+
 
 # ---------------------------------------------------------------------------
 # Tags handler
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+# The str() of a list of plain (key, value) string tuples, e.g. [('env', 'prod')].
+# Strings with quotes or backslashes are repr'd differently and do not match.
+_AWS_TAG_PAIR = r"\('([^'\\]*)', '([^'\\]*)'\)"
+_AWS_TAG_LIST_RE = re.compile(rf"\[{_AWS_TAG_PAIR}(?:, {_AWS_TAG_PAIR})*\]")
+_AWS_TAG_PAIR_RE = re.compile(_AWS_TAG_PAIR)
+
+
+def _load_json(value: str) -> object:
+    """Parse *value* exactly as json.loads would, using orjson when it is installed.
+
+    orjson rejects some JSON the standard library accepts (lone surrogate escapes,
+    numbers beyond double range) and reads integers wider than 64 bits as floats, so
+    those inputs are parsed again with json.loads instead of being passed through.
+    """
+    if orjson is None:
+        return json.loads(value)
+    try:
+        parsed = orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return json.loads(value)
+    if isinstance(parsed, dict) and any(isinstance(val, float) for val in parsed.values()):
+        return json.loads(value)
+    return parsed
+
+
+def _parse_aws_tags(value: str) -> object:
+    """Parse an AWS tag list string, as ast.literal_eval would.
+
+    Tag lists are written by str() and almost always hold plain string pairs, which
+    a regex extracts directly; anything else goes through ast.literal_eval.
+    """
+    if _AWS_TAG_LIST_RE.fullmatch(value):
+        return _AWS_TAG_PAIR_RE.findall(value)
+    return ast.literal_eval(value)
+
+
+@dataclass(slots=True)
 class TagsHandler:
     """Scrubs Tags column by scrambling values while preserving keys.
 
@@ -526,7 +722,6 @@ class TagsHandler:
 
     mapping_engine: MappingEngine
     scrub_tag_keys: bool = False
-    _char_map: dict[str, str] = field(default_factory=dict, init=False, repr=False)
     _column_name: str = field(default="", init=False, repr=False)
     _collector: MappingCollector | None = field(default=None, init=False, repr=False)
 
@@ -534,38 +729,12 @@ class TagsHandler:
         self._column_name = column_name
         self._collector = collector
 
-    def _get_char_mapping(self, char: str) -> str:
-        """Get or create a random character mapping."""
-        if char not in self._char_map:
-            import random
-            import string
-
-            # Map to same character class
-            if char.isupper():
-                self._char_map[char] = random.choice(string.ascii_uppercase)
-            elif char.islower():
-                self._char_map[char] = random.choice(string.ascii_lowercase)
-            elif char.isdigit():
-                self._char_map[char] = random.choice(string.digits)
-            else:
-                # Non-alphanumeric characters stay the same
-                self._char_map[char] = char
-
-        return self._char_map[char]
-
-    def _scramble_string(self, value: str) -> str:
-        """Scramble a string by mapping each alphanumeric character."""
-        return "".join(self._get_char_mapping(c) for c in value)
-
     def scrub(self, value: object) -> object:
-        # Handle scalar NA values
-        try:
-            if pd.isna(value):
-                return value
-        except (ValueError, TypeError):
-            # Non-scalar or incompatible type, continue processing
-            pass
+        if _is_na(value):
+            return value
+        return self._scrub_one(value)
 
+    def _scrub_one(self, value: object) -> object:
         # Handle actual list objects (AWS parquet format)
         if isinstance(value, list):
             if not value:  # Empty list
@@ -573,10 +742,11 @@ class TagsHandler:
             # Scramble values and optionally keys
             if self.scrub_tag_keys:
                 scrubbed_list = [
-                    (self._scramble_string(key), self._scramble_string(val)) for key, val in value
+                    (self.mapping_engine.scramble(key), self.mapping_engine.scramble(val))
+                    for key, val in value
                 ]
             else:
-                scrubbed_list = [(key, self._scramble_string(val)) for key, val in value]
+                scrubbed_list = [(key, self.mapping_engine.scramble(val)) for key, val in value]
             if self._collector is not None:
                 self._collector.record(self._column_name, str(value), str(scrubbed_list))
             return scrubbed_list
@@ -587,57 +757,59 @@ class TagsHandler:
                 return value
             if self.scrub_tag_keys:
                 scrubbed_dict = {
-                    self._scramble_string(key): self._scramble_string(val) if val else val
+                    self.mapping_engine.scramble(key): self.mapping_engine.scramble(val)
+                    if val
+                    else val
                     for key, val in value.items()
                 }
             else:
                 scrubbed_dict = {
-                    key: self._scramble_string(val) if val else val for key, val in value.items()
+                    key: self.mapping_engine.scramble(val) if val else val
+                    for key, val in value.items()
                 }
             if self._collector is not None:
                 self._collector.record(self._column_name, str(value), str(scrubbed_dict))
             return scrubbed_dict
 
-        original = str(value).strip()
+        original = _as_str(value).strip()
 
         # Handle empty lists/dicts as strings
         if original in ("[]", "{}", ""):
             return value
 
         # Try to detect format and parse
-        import ast
-        import json
-
         try:
             # AWS format: list of tuples (comes in as string representation)
             if original.startswith("["):
-                tags_list = ast.literal_eval(original)
+                tags_list = _parse_aws_tags(original)
                 if isinstance(tags_list, list):
                     # Scramble values and optionally keys
                     if self.scrub_tag_keys:
                         scrubbed_list = [
-                            (self._scramble_string(key), self._scramble_string(val))
+                            (self.mapping_engine.scramble(key), self.mapping_engine.scramble(val))
                             for key, val in tags_list
                         ]
                     else:
                         scrubbed_list = [
-                            (key, self._scramble_string(val)) for key, val in tags_list
+                            (key, self.mapping_engine.scramble(val)) for key, val in tags_list
                         ]
                     replacement = str(scrubbed_list)
                 else:
                     replacement = original
             # Azure/OCI format: JSON string
             elif original.startswith("{"):
-                tags_dict = json.loads(original)
+                tags_dict = _load_json(original)
                 # Scramble values and optionally keys
                 if self.scrub_tag_keys:
                     scrubbed_dict = {
-                        self._scramble_string(key): self._scramble_string(val) if val else val
+                        self.mapping_engine.scramble(key): self.mapping_engine.scramble(val)
+                        if val
+                        else val
                         for key, val in tags_dict.items()
                     }
                 else:
                     scrubbed_dict = {
-                        key: self._scramble_string(val) if val else val
+                        key: self.mapping_engine.scramble(val) if val else val
                         for key, val in tags_dict.items()
                     }
                 replacement = json.dumps(scrubbed_dict, separators=(",", ":"))
@@ -653,8 +825,13 @@ class TagsHandler:
 
         return replacement
 
+    def scrub_series(self, series: pd.Series) -> pd.Series:
+        # Tag sets repeat per resource; lists and dicts are not hashable and
+        # fall back to per-value scrubbing
+        return _scrub_present(series, lambda values: _scrub_unique(values, self._scrub_one))
+
 
-@dataclass
+@dataclass(slots=True)
 class UnmappedScrambleStringHandler:
     """Deterministically scramble string character order without storing mappings."""
 
@@ -663,13 +840,12 @@ class UnmappedScrambleStringHandler:
         return
 
     def scrub(self, value: object) -> object:
-        try:
-            if pd.isna(value):
-                return value
-        except (ValueError, TypeError):
-            pass
+        if _is_na(value):
+            return value
+        return self._scrub_one(value)
 
-        original = str(value)
+    def _scrub_one(self, value: object) -> object:
+        original = _as_str(value)
         if len(original) <= 1:
             return original
 
@@ -687,13 +863,17 @@ class UnmappedScrambleStringHandler:
 
         return scrambled
 
+    def scrub_series(self, series: pd.Series) -> pd.Series:
+        # The scramble is a pure function of the value; compute it once per value
+        return _scrub_present(series, lambda values: _scrub_unique(values, self._scrub_one))
+
 
 # ---------------------------------------------------------------------------
 # Handler config + factories
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HandlerConfig:
     date_shift_days: int = 0
     scrub_tag_keys: bool = False
@@ -746,49 +926,34 @@ HANDLER_FACTORIES: dict[str, HandlerFactory] = {
     "UnmappedScrambleString": _build_unmapped_scamble_string_handler,
 }
 
-# Dataset-specific column mapping.
-#
-# Map dataset name -> (column name -> handler name).
-DATASET_COLUMN_HANDLER_NAMES: dict[str, dict[str, str]] = {
-    "CostAndUsage": {
-        "BillingPeriodStart": "DateReformat",
-        "BillingPeriodEnd": "DateReformat",
-        "ChargePeriodStart": "DateReformat",
-        "ChargePeriodEnd": "DateReformat",
-        "BillingAccountId": "AccountId",
-        "BillingAccountName": "StellarName",
-        "SubAccountId": "AccountId",
-        "SubAccountName": "StellarName",
-        "CommitmentDiscountId": "CommitmentDiscountId",
-        "ResourceId": "ResourceId",
-        "Tags": "Tags",
-        "oci_ReferenceNumber": "unmapped_scamble_string",
-        "oci_CompartmentId": "ResourceId",
-        "oci_CompartmentName": "StellarName",
-        "x_BillingAccountName": "StellarName",
-        "x_BillingAccountId": "AccountId",
-        "x_BillingProfileId": "AccountId",
-        "x_CustomerName": "StellarName",
-        "x_InvoiceSectionId": "AccountId",
-        "x_ResourceGroupName": "StellarName",
-    },
-    "ContractCommitment": {
-        "ContractCommitmentPeriodStart": "DateReformat",
-        "ContractCommitmentPeriodEnd": "DateReformat",
-        "ContractPeriodStart": "DateReformat",
-        "ContractPeriodEnd": "DateReformat",
-        "BillingAccountId": "AccountId",
-        "BillingAccountName": "StellarName",
-        "SubAccountId": "AccountId",
-        "SubAccountName": "StellarName",
-        "CommitmentDiscountId": "CommitmentDiscountId",
-        "Tags": "Tags",
-    },
-}
 
+@cache
+def _resolve_handler_factories(
+    dataset_name: str, dates_only: bool
+) -> tuple[tuple[str, HandlerFactory], ...]:
+    """Return the validated ``(column, factory)`` pairs used to build a dataset's handlers.
 
-def list_datasets() -> list[str]:
-    return sorted(DATASET_COLUMN_HANDLER_NAMES.keys())
+    The dataset/handler tables are static, so the lookup and validation are done once
+    per ``(dataset, dates_only)``. Handlers themselves are stateful and built per call.
+    """
+    if dataset_name not in DATASET_COLUMN_HANDLER_NAMES:
+        supported = ", ".join(list_datasets())
+        raise ValueError(f"Unknown dataset '{dataset_name}'. Supported datasets: {supported}")
+
+    factories: list[tuple[str, HandlerFactory]] = []
+    for column_name, handler_name in DATASET_COLUMN_HANDLER_NAMES[dataset_name].items():
+        # If dates_only mode, skip non-date handlers
+        if dates_only and handler_name != "DateReformat":
+            continue
+
+        if handler_name not in HANDLER_FACTORIES:
+            raise ValueError(
+                f"Dataset '{dataset_name}' references unknown handler "
+                f"'{handler_name}' for column '{column_name}'."
+            )
+        factories.append((column_name, HANDLER_FACTORIES[handler_name]))
+
+    return tuple(factories)
 
 
 def get_column_handlers_for_dataset(
@@ -798,11 +963,7 @@ def get_column_handlers_for_dataset(
     collector: MappingCollector | None = None,
     mapping_engine: MappingEngine | None = None,
 ) -> tuple[dict[str, ColumnHandler], MappingEngine]:
-    if dataset_name not in DATASET_COLUMN_HANDLER_NAMES:
-        supported = ", ".join(list_datasets())
-        raise ValueError(f"Unknown dataset '{dataset_name}'. Supported datasets: {supported}")
-
-    column_to_handler_name = DATASET_COLUMN_HANDLER_NAMES[dataset_name]
+    factories = _resolve_handler_factories(dataset_name, config.dates_only)
     column_handlers: dict[str, ColumnHandler] = {}
 
     # Create a shared mapping engine for all handlers to ensure consistent mappings
@@ -810,19 +971,9 @@ def get_column_handlers_for_dataset(
     if mapping_engine is None:
         mapping_engine = MappingEngine()
 
-    for column_name, handler_name in column_to_handler_name.items():
-        # If dates_only mode, skip non-date handlers
-        if config.dates_only and handler_name != "DateReformat":
-            continue
-
-        if handler_name not in HANDLER_FACTORIES:
-            raise ValueError(
-                f"Dataset '{dataset_name}' references unknown handler "
-                f"'{handler_name}' for column '{column_name}'."
-            )
-
+    for column_name, factory in factories:
         # Create handler using the factory with the shared mapping engine
-        handler = HANDLER_FACTORIES[handler_name](config, mapping_engine)
+        handler = factory(config, mapping_engine)
 
         if collector is not None:
             handler.attach_collector(column_name, collector)
@@ -1,18 +1,39 @@
 from __future__ import annotations
 
-from enum import Enum
+import gzip
+import os
+import shutil
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 
+from focus_scrub.formats import (
+    DEFAULT_BATCH_SIZE,
+    SUPPORTED_INPUT_EXTENSIONS,
+    FileFormat,
+    ParquetOptions,
+)
 
-class FileFormat(str, Enum):
-    CSV_GZIP = "csv-gzip"
-    PARQUET = "parquet"
-    SQL = "sql"
 
+# Parquet encoding used by whole-file and streaming writes unless overridden.
+_DEFAULT_PARQUET_OPTIONS = ParquetOptions()
 
-SUPPORTED_INPUT_EXTENSIONS: tuple[str, ...] = (".csv", ".csv.gz", ".parquet")
+# Large blocks keep the multithreaded Arrow CSV reader busy on wide FOCUS exports and
+# give the schema probe in _read_csv_arrow a representative sample of rows.
+_CSV_BLOCK_SIZE = 16 << 20
+
+# gzip's own default; level 9 costs ~45% more CSV write time for ~2% smaller files.
+_GZIP_COMPRESSLEVEL = 6
+
+# writer(df, output_file, sql_table_name)
+FocusFileWriter = Callable[[pd.DataFrame, Path, str | None], None]
 
 
 def discover_focus_files(input_path: Path) -> list[Path]:
@@ -29,18 +50,140 @@ def discover_focus_files(input_path: Path) -> list[Path]:
 
 
 def read_focus_file(path: Path) -> pd.DataFrame:
+    return _READERS[_input_extension(path)](path)
+
+
+def read_focus_table(path: Path) -> pa.Table:
+    """Read a FOCUS file as an Arrow table, without going through pandas where possible."""
+    return _TABLE_READERS[_input_extension(path)](path)
+
+
+def _input_extension(path: Path) -> str:
+    """Return the reader key (``.parquet``, ``.csv.gz`` or ``.csv``) for *path*."""
+    for extension in _READERS:
+        if path.name.endswith(extension):
+            return extension
+    raise ValueError(f"Unsupported input format: {path}")
+
+
+def _read_csv(path: Path) -> pd.DataFrame:
+    table = _read_csv_table(path)
+    if table is not None:
+        return table.to_pandas(self_destruct=True)
+    # Avoid mixed-type chunk inference warnings on large FOCUS CSV files.
+    return pd.read_csv(path, low_memory=False)
+
+
+def _read_csv_as_table(path: Path) -> pa.Table:
+    table = _read_csv_table(path)
+    if table is not None:
+        return table
+    df = pd.read_csv(path, low_memory=False)
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def _read_csv_table(path: Path) -> pa.Table | None:
+    """Read a CSV (optionally gzipped) with Arrow's multithreaded reader.
+
+    Columns Arrow would infer as dates or timestamps are kept as strings, matching
+    ``pd.read_csv`` so handlers see the same values whichever reader is used. Returns
+    None when Arrow rejects the file or a temporal column only shows up after the
+    first block, leaving the file to the pandas reader.
+    """
+    read_options = pa_csv.ReadOptions(block_size=_CSV_BLOCK_SIZE, use_threads=True)
+    try:
+        # Opening a streaming reader only parses the first block to infer the schema.
+        with pa_csv.open_csv(str(path), read_options=read_options) as probe:
+            column_types = {
+                field.name: pa.string()
+                for field in probe.schema
+                if pa.types.is_temporal(field.type)
+            }
+        table = pa_csv.read_csv(
+            str(path),
+            read_options=read_options,
+            convert_options=pa_csv.ConvertOptions(
+                column_types=column_types, strings_can_be_null=True
+            ),
+        )
+    except pa.ArrowInvalid:
+        return None
+    if any(pa.types.is_temporal(field.type) for field in table.schema):
+        return None
+    return table
+
+
+def read_focus_file_batches(
+    path: Path, batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[pd.DataFrame]:
+    """Yield a FOCUS file as DataFrames of at most *batch_size* rows.
+
+    Always yields at least one (possibly empty) frame so the output schema is known.
+    """
     suffixes = path.suffixes
 
     if path.suffix == ".parquet":
-        return pd.read_parquet(path)
+        parquet_file = pq.ParquetFile(path)
+        empty = True
+        for batch in parquet_file.iter_batches(batch_size=batch_size):
+            empty = False
+            yield pa.Table.from_batches([batch]).to_pandas()
+        if empty:
+            yield parquet_file.schema_arrow.empty_table().to_pandas()
+        return
 
     if suffixes[-2:] == [".csv", ".gz"] or path.suffix == ".csv":
-        # Avoid mixed-type chunk inference warnings on large FOCUS CSV files.
-        return pd.read_csv(path, low_memory=False)
+        yield from _read_csv_batches(path, batch_size)
+        return
 
     raise ValueError(f"Unsupported input format: {path}")
 
 
+def _read_csv_batches(path: Path, batch_size: int) -> Iterator[pd.DataFrame]:
+    """Yield a CSV (optionally gzipped) in batches that all share one schema.
+
+    ``pd.read_csv(chunksize=...)`` infers dtypes per chunk, so a sparse column can be
+    float64 in one batch and strings in the next. Arrow's streaming reader fixes the
+    schema from its first block instead: temporal columns are kept as strings like
+    _read_csv_table, and columns that are still empty in that block are read as
+    strings. Files Arrow rejects are read by pandas with every column as text.
+    """
+    read_options = pa_csv.ReadOptions(block_size=_CSV_BLOCK_SIZE, use_threads=True)
+    try:
+        with pa_csv.open_csv(str(path), read_options=read_options) as probe:
+            column_types = {
+                field.name: pa.string()
+                for field in probe.schema
+                if pa.types.is_temporal(field.type) or pa.types.is_null(field.type)
+            }
+        reader = pa_csv.open_csv(
+            str(path),
+            read_options=read_options,
+            convert_options=pa_csv.ConvertOptions(
+                column_types=column_types, strings_can_be_null=True
+            ),
+        )
+    except pa.ArrowInvalid:
+        with pd.read_csv(path, dtype=str, chunksize=batch_size) as chunks:
+            yield from chunks
+        return
+
+    with reader:
+        empty = True
+        try:
+            for batch in reader:
+                for offset in range(0, batch.num_rows, batch_size):
+                    empty = False
+                    yield pa.Table.from_batches([batch.slice(offset, batch_size)]).to_pandas()
+        except pa.ArrowInvalid as error:
+            raise ValueError(
+                f"{path}: column values no longer match the types inferred from the start "
+                f"of the file ({error}); scrub it without --stream"
+            ) from error
+        if empty:
+            yield reader.schema.empty_table().to_pandas()
+
+
 def output_path_for_file(
     input_file: Path,
     input_root: Path,
@@ -68,27 +211,164 @@ def write_focus_file(
     output_file: Path,
     output_format: FileFormat,
     sql_table_name: str | None = None,
+    *,
+    ensure_parent: bool = True,
+    parquet_options: ParquetOptions | None = None,
 ) -> None:
-    output_file.parent.mkdir(parents=True, exist_ok=True)
+    writer = get_focus_file_writer(output_format, parquet_options)
+    if ensure_parent:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+    writer(df, output_file, sql_table_name)
 
-    if output_format == FileFormat.CSV_GZIP:
-        df.to_csv(output_file, index=False, compression="gzip")
-        return
 
-    if output_format == FileFormat.PARQUET:
-        df.to_parquet(output_file, index=False)
-        return
+def get_focus_file_writer(
+    output_format: FileFormat, parquet_options: ParquetOptions | None = None
+) -> FocusFileWriter:
+    """Return the ``writer(df, output_file, sql_table_name)`` function for *output_format*.
 
-    if output_format == FileFormat.SQL:
-        _write_sql_insert_statements(df, output_file, sql_table_name)
+    The output format is fixed for a whole run, so callers writing many files can
+    resolve the writer once. Unlike write_focus_file, it does not create parent
+    directories.
+    """
+    try:
+        writer = _WRITERS[output_format]
+    except KeyError:
+        raise ValueError(f"Unsupported output format: {output_format}") from None
+    if output_format == FileFormat.PARQUET and parquet_options is not None:
+        return partial(_write_parquet, parquet_options=parquet_options)
+    return writer
+
+
+def write_focus_table(
+    table: pa.Table,
+    output_file: Path,
+    output_format: FileFormat,
+    sql_table_name: str | None = None,
+    *,
+    ensure_parent: bool = True,
+    parquet_options: ParquetOptions | None = None,
+) -> None:
+    """Write an Arrow table; Parquet is written directly, other formats via pandas."""
+    if output_format != FileFormat.PARQUET:
+        write_focus_file(
+            table.to_pandas(),
+            output_file,
+            output_format,
+            sql_table_name=sql_table_name,
+            ensure_parent=ensure_parent,
+        )
         return
 
-    raise ValueError(f"Unsupported output format: {output_format}")
+    if ensure_parent:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+    _write_parquet_table(table, output_file, parquet_options or _DEFAULT_PARQUET_OPTIONS)
+
+
+def _write_csv_gzip(df: pd.DataFrame, output_file: Path, sql_table_name: str | None) -> None:
+    with _atomic_output(output_file) as temp_file:
+        df.to_csv(
+            temp_file,
+            index=False,
+            compression={"method": "gzip", "compresslevel": _GZIP_COMPRESSLEVEL},
+        )
+
+
+def _write_parquet(
+    df: pd.DataFrame,
+    output_file: Path,
+    sql_table_name: str | None,
+    parquet_options: ParquetOptions = _DEFAULT_PARQUET_OPTIONS,
+) -> None:
+    # from_pandas converts columns in parallel on Arrow's thread pool
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    _write_parquet_table(table, output_file, parquet_options)
+
+
+def _write_parquet_table(table: pa.Table, output_file: Path, options: ParquetOptions) -> None:
+    with _atomic_output(output_file) as temp_file:
+        pq.write_table(
+            table, temp_file, row_group_size=options.row_group_size, **options.writer_kwargs()
+        )
+
+
+def write_focus_file_batches(
+    batches: Iterable[pd.DataFrame],
+    output_file: Path,
+    output_format: FileFormat,
+    *,
+    ensure_parent: bool = True,
+    parquet_options: ParquetOptions | None = None,
+) -> None:
+    """Write DataFrame batches to a single output file without holding them all in memory.
+
+    Supports Parquet (one row group per batch, split further past the row group size)
+    and gzip-compressed CSV. The schema of the first batch is used for the whole file
+    and later batches are cast to it. *output_file* only appears once every batch has
+    been written; if a batch fails, no output is left behind.
+    """
+    if ensure_parent:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+
+    if output_format not in (FileFormat.PARQUET, FileFormat.CSV_GZIP):
+        raise ValueError(f"Streaming is not supported for output format: {output_format}")
+
+    with _atomic_output(output_file) as temp_file:
+        if output_format == FileFormat.PARQUET:
+            options = parquet_options or _DEFAULT_PARQUET_OPTIONS
+            writer: pq.ParquetWriter | None = None
+            try:
+                for df in batches:
+                    table = pa.Table.from_pandas(df, preserve_index=False)
+                    if writer is None:
+                        writer = pq.ParquetWriter(
+                            temp_file, _batch_file_schema(table.schema), **options.writer_kwargs()
+                        )
+                    # Later batches may infer narrower or different types for the same column
+                    writer.write_table(
+                        table.cast(writer.schema), row_group_size=options.row_group_size
+                    )
+            finally:
+                if writer is not None:
+                    writer.close()
+        else:
+            with gzip.open(temp_file, "wt", compresslevel=_GZIP_COMPRESSLEVEL, newline="") as f:
+                for index, df in enumerate(batches):
+                    df.to_csv(f, index=False, header=index == 0)
+
+
+@contextmanager
+def _atomic_output(output_file: Path) -> Iterator[Path]:
+    """Yield a temporary path to write *output_file* to, moved into place on success.
+
+    All writers go through this, so an output that exists is a complete one and
+    --skip-existing never keeps a truncated file. The temporary file lives in a hidden
+    directory next to *output_file*: it keeps the same name (gzip records it in its
+    header) and the rename stays on one filesystem. On failure it is removed and
+    *output_file* is left as it was.
+    """
+    temp_dir = Path(tempfile.mkdtemp(prefix=".focus-scrub-", dir=output_file.parent))
+    try:
+        temp_file = temp_dir / output_file.name
+        yield temp_file
+        os.replace(temp_file, output_file)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _batch_file_schema(schema: pa.Schema) -> pa.Schema:
+    """Return the schema for a batched Parquet file from its first batch's *schema*.
+
+    A column with only nulls in the first batch has no type yet; it is written as
+    string so later batches with values can be cast to it.
+    """
+    for index, field in enumerate(schema):
+        if pa.types.is_null(field.type):
+            schema = schema.set(index, field.with_type(pa.string()))
+    return schema
 
 
 def _is_supported_input_file(path: Path) -> bool:
-    name = path.name.lower()
-    return name.endswith(".csv") or name.endswith(".csv.gz") or name.endswith(".parquet")
+    return path.name.lower().endswith(SUPPORTED_INPUT_EXTENSIONS)
 
 
 def _strip_known_extensions(path: Path) -> str:
@@ -134,7 +414,7 @@ def _write_sql_insert_statements(
     # Sanitize table name (replace hyphens/spaces/periods with underscores)
     table_name = table_name.replace("-", "_").replace(" ", "_").replace(".", "_")
 
-    with open(output_file, "w") as f:
+    with _atomic_output(output_file) as temp_file, open(temp_file, "w") as f:
         # Write header comment
         f.write("-- FOCUS Scrubbed Data\n")
         f.write(f"-- Table: {table_name}\n")
@@ -212,3 +492,22 @@ def _write_sql_insert_statements(
                     f.write(f"  ({value_list}),\n")
                 else:
                     f.write(f"  ({value_list});\n\n")
+
+
+# Dispatch tables, checked in order by _input_extension (.csv.gz before .csv).
+_READERS: dict[str, Callable[[Path], pd.DataFrame]] = {
+    ".parquet": pd.read_parquet,
+    ".csv.gz": _read_csv,
+    ".csv": _read_csv,
+}
+_TABLE_READERS: dict[str, Callable[[Path], pa.Table]] = {
+    ".parquet": pq.read_table,
+    ".csv.gz": _read_csv_as_table,
+    ".csv": _read_csv_as_table,
+}
+
+_WRITERS: dict[FileFormat, FocusFileWriter] = {
+    FileFormat.CSV_GZIP: _write_csv_gzip,
+    FileFormat.PARQUET: _write_parquet,
+    FileFormat.SQL: _write_sql_insert_statements,
+}
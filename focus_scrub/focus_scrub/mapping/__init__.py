@@ -2,6 +2,17 @@
 
 from focus_scrub.mapping.collector import MappingCollector
 from focus_scrub.mapping.engine import MappingEngine
+from focus_scrub.mapping.files import (
+    check_mappings_path,
+    read_mappings_file,
+    write_mappings_file,
+)
 
 
-__all__ = ["MappingCollector", "MappingEngine"]
+__all__ = [
+    "MappingCollector",
+    "MappingEngine",
+    "check_mappings_path",
+    "read_mappings_file",
+    "write_mappings_file",
+]
@@ -2,21 +2,32 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 
 class MappingCollector:
     """Accumulates old->new mappings reported by handlers across all files."""
 
     def __init__(self) -> None:
-        self._mappings: dict[str, list[tuple[str, str]]] = {}
-        self._seen: dict[str, set[str]] = {}
+        # Column name -> {original: replacement}, in first-seen order
+        self._mappings: dict[str, dict[str, str]] = {}
 
     def record(self, column_name: str, original: str, replacement: str) -> None:
-        if column_name not in self._mappings:
-            self._mappings[column_name] = []
-            self._seen[column_name] = set()
-        if original not in self._seen[column_name]:
-            self._mappings[column_name].append((original, replacement))
-            self._seen[column_name].add(original)
-
-    def to_dict(self) -> dict[str, list[tuple[str, str]]]:
-        return {col: list(pairs) for col, pairs in self._mappings.items()}
+        column_mappings = self._mappings.setdefault(column_name, {})
+        if original not in column_mappings:
+            column_mappings[original] = replacement
+
+    def record_many(self, column_name: str, pairs: Iterable[tuple[str, str]]) -> None:
+        """Record several (original, replacement) pairs for one column in a single call."""
+        setdefault = self._mappings.setdefault(column_name, {}).setdefault
+        for original, replacement in pairs:
+            setdefault(original, replacement)
+
+    def to_dict(self) -> dict[str, dict[str, str]]:
+        """Return the recorded {column: {original: replacement}} mappings.
+
+        The collector's own dicts are returned without copying, since an export can
+        hold millions of pairs. Treat the result as read-only; it reflects any later
+        record() calls.
+        """
+        return self._mappings
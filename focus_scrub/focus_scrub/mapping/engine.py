@@ -12,9 +12,8 @@ def _random_digits(length: int) -> str:
     """Return a random digit string of *length* with a non-zero leading digit."""
     if length <= 0:
         return ""
-    first = random.choice(string.digits[1:])
-    rest = "".join(random.choices(string.digits, k=length - 1))
-    return first + rest
+    # One big-int draw is uniform over exactly the *length*-digit numbers
+    return str(random.randrange(10 ** (length - 1), 10**length))
 
 
 def _stellar_name_generator() -> Iterator[str]:
@@ -92,9 +91,49 @@ def _stellar_name_generator() -> Iterator[str]:
         count += 1
 
 
+# Replacement alphabets for scrambled characters
+_UPPER = tuple(string.ascii_uppercase)
+_LOWER = tuple(string.ascii_lowercase)
+_DIGITS = tuple(string.digits)
+# Replacement alphabet for profile code segments
+_PROFILE_CODE_CHARS = string.ascii_uppercase + string.digits
+
+
+class _CharTable(dict[int, str]):
+    """A str.translate table that picks a random replacement for each new character.
+
+    str.translate looks characters up in C, so only the first sight of a character
+    runs Python code (through __missing__).
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        # Map to same character class
+        if char.isupper():
+            replacement = random.choice(_UPPER)
+        elif char.islower():
+            replacement = random.choice(_LOWER)
+        elif char.isdigit():
+            replacement = random.choice(_DIGITS)
+        else:
+            # Non-alphanumeric characters stay the same
+            replacement = char
+        self[codepoint] = replacement
+        return replacement
+
+
 class MappingEngine:
     """Central mapping engine that ensures consistent mappings across all columns."""
 
+    __slots__ = (
+        "_number_id_map",
+        "_uuid_map",
+        "_name_map",
+        "_profile_code_map",
+        "_name_generator",
+        "_char_table",
+    )
+
     def __init__(self) -> None:
         # Separate mapping dictionaries for each strategy
         self._number_id_map: dict[str, str] = {}
@@ -102,11 +141,14 @@ class MappingEngine:
         self._name_map: dict[str, str] = {}
         self._profile_code_map: dict[str, str] = {}
         self._name_generator: Iterator[str] | None = None
+        # Character scrambling is shared so a string scrambles the same in every column
+        self._char_table = _CharTable()
 
     def map_number_id(self, value: str) -> str:
         """Map a numeric ID to another numeric ID of the same length."""
-        if value in self._number_id_map:
-            return self._number_id_map[value]
+        replacement = self._number_id_map.get(value)
+        if replacement is not None:
+            return replacement
 
         replacement = _random_digits(len(value))
         self._number_id_map[value] = replacement
@@ -114,8 +156,9 @@ class MappingEngine:
 
     def map_uuid(self, value: str) -> str:
         """Map a UUID to a new random UUID."""
-        if value in self._uuid_map:
-            return self._uuid_map[value]
+        replacement = self._uuid_map.get(value)
+        if replacement is not None:
+            return replacement
 
         replacement = str(uuid.uuid4())
         self._uuid_map[value] = replacement
@@ -123,8 +166,9 @@ class MappingEngine:
 
     def map_name(self, value: str) -> str:
         """Map a name to a stellar-themed name."""
-        if value in self._name_map:
-            return self._name_map[value]
+        replacement = self._name_map.get(value)
+        if replacement is not None:
+            return replacement
 
         if self._name_generator is None:
             self._name_generator = _stellar_name_generator()
@@ -135,18 +179,22 @@ class MappingEngine:
 
     def map_profile_code(self, value: str) -> str:
         """Map a profile code to a random profile code of the same structure."""
-        if value in self._profile_code_map:
-            return self._profile_code_map[value]
+        replacement = self._profile_code_map.get(value)
+        if replacement is not None:
+            return replacement
 
         segments = value.split("-")
         random_segments = [
-            "".join(random.choices(string.ascii_uppercase + string.digits, k=len(seg)))
-            for seg in segments
+            "".join(random.choices(_PROFILE_CODE_CHARS, k=len(seg))) for seg in segments
         ]
         replacement = "-".join(random_segments)
         self._profile_code_map[value] = replacement
         return replacement
 
+    def scramble(self, value: str) -> str:
+        """Scramble a string by mapping each alphanumeric character."""
+        return value.translate(self._char_table)
+
     def get_all_mappings(self) -> dict[str, dict[str, str]]:
         """Return all mappings grouped by strategy."""
         return {
@@ -169,3 +217,29 @@ class MappingEngine:
             self._name_map.update(mappings["Name"])
         if "ProfileCode" in mappings:
             self._profile_code_map.update(mappings["ProfileCode"])
+
+    def load_bulk(self, mappings: dict[str, dict[str, str]]) -> None:
+        """Load mappings like load_mappings, taking ownership of the given dicts.
+
+        A strategy map that is still empty adopts the loaded dict as-is instead of
+        copying it entry by entry, which matters for large mapping files. Callers must
+        not modify *mappings* afterwards.
+        """
+        for key, attribute in _MAPPING_ATTRIBUTES.items():
+            loaded = mappings.get(key)
+            if loaded is None:
+                continue
+            current: dict[str, str] = getattr(self, attribute)
+            if current:
+                current.update(loaded)
+            else:
+                setattr(self, attribute, loaded)
+
+
+# Exported mapping key -> MappingEngine attribute holding that strategy's mappings
+_MAPPING_ATTRIBUTES = {
+    "NumberId": "_number_id_map",
+    "UUID": "_uuid_map",
+    "Name": "_name_map",
+    "ProfileCode": "_profile_code_map",
+}
@@ -0,0 +1,69 @@
+"""Reading and writing exported mapping files.
+
+Files are JSON unless their suffix is ``.msgpack``, a compact binary format that is
+faster to load when the file is only passed between runs of this tool.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+
+# orjson is optional; it encodes/decodes large mapping files several times faster
+# than the standard library and works on bytes directly.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - depends on the environment
+    msgpack = None
+
+# I/O buffer for the standard library fallback (1 MiB).
+_BUFFER_SIZE = 1 << 20
+
+MSGPACK_SUFFIX = ".msgpack"
+
+
+def check_mappings_path(path: Path) -> None:
+    """Raise ValueError if the format chosen by *path*'s suffix cannot be used here."""
+    if _is_msgpack(path) and msgpack is None:
+        raise ValueError(
+            f"{path}: {MSGPACK_SUFFIX} mapping files require the optional msgpack package."
+        )
+
+
+def read_mappings_file(path: Path) -> dict[str, Any]:
+    """Load a mappings file written by write_mappings_file."""
+    if _is_msgpack(path):
+        check_mappings_path(path)
+        return msgpack.unpackb(path.read_bytes(), raw=False)
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    # json.load accepts UTF-8 bytes, so skip decoding the file into one big str
+    with path.open("rb", buffering=_BUFFER_SIZE) as f:
+        return json.load(f)
+
+
+def write_mappings_file(path: Path, data: dict[str, Any]) -> None:
+    """Write *data* to *path*, as msgpack for a ``.msgpack`` suffix, else indented JSON."""
+    if _is_msgpack(path):
+        check_mappings_path(path)
+        path.write_bytes(msgpack.packb(data, use_bin_type=True))
+        return
+    if orjson is not None:
+        # OPT_NON_STR_KEYS stringifies non-str keys the way json.dump does
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    # Encode straight into a buffered file rather than building the whole JSON
+    # document in memory first; mapping tables from large runs can be big.
+    with path.open("w", buffering=_BUFFER_SIZE) as f:
+        json.dump(data, f, indent=2)
+
+
+def _is_msgpack(path: Path) -> bool:
+    return path.suffix.lower() == MSGPACK_SUFFIX
@@ -0,0 +1,116 @@
+"""Pipelined read -> scrub -> write processing across many input files."""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import TypeVar
+
+
+# Marks the end of a stage's input.
+_DONE = object()
+
+# The in-memory form of a file between stages (a DataFrame or an Arrow table).
+Frame = TypeVar("Frame")
+
+
+def _run_stage(
+    func: Callable[[Path, object], object],
+    inbox: queue.Queue,
+    outbox: queue.Queue,
+    failed: threading.Event,
+) -> None:
+    """Apply *func* to every ``(index, input_file, payload)`` item until the end marker.
+
+    The end marker is put back on *inbox* so sibling threads of the same stage also
+    stop. Exceptions are forwarded downstream in place of the result. Once any stage
+    has failed, remaining items are dropped without doing further work.
+    """
+    while True:
+        item = inbox.get()
+        if item is _DONE:
+            inbox.put(_DONE)
+            outbox.put(_DONE)
+            return
+
+        index, input_file, payload = item
+        if isinstance(payload, BaseException):
+            outbox.put(item)
+            continue
+        if failed.is_set():
+            continue
+
+        try:
+            result = func(input_file, payload)
+        except BaseException as exc:
+            failed.set()
+            result = exc
+        outbox.put((index, input_file, result))
+
+
+def run_pipeline(
+    files: Iterable[Path],
+    *,
+    read: Callable[[Path], Frame],
+    scrub: Callable[[Frame], Frame],
+    write: Callable[[Path, Frame], Path],
+    writers: int = 1,
+    queue_size: int = 2,
+) -> Iterator[tuple[Path, Path]]:
+    """Process files through reader, scrubber and writer threads joined by bounded queues.
+
+    While one file is being scrubbed, the next is read and up to *writers* previous
+    files are encoded and written. Scrubbing runs on a single thread, so handlers and
+    their shared MappingEngine are never used concurrently. Yields
+    ``(input_file, destination)`` in input order; the first exception raised by any
+    stage is re-raised once the pipeline has drained.
+    """
+    pending: queue.Queue = queue.Queue()
+    for index, input_file in enumerate(files):
+        pending.put((index, input_file, None))
+    pending.put(_DONE)
+
+    read_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    scrub_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    done_queue: queue.Queue = queue.Queue()
+    failed = threading.Event()
+
+    stages = [
+        (lambda input_file, _: read(input_file), pending, read_queue),
+        (lambda _, df: scrub(df), read_queue, scrub_queue),
+    ] + [(write, scrub_queue, done_queue)] * writers
+    threads = [
+        threading.Thread(target=_run_stage, args=(func, inbox, outbox, failed), daemon=True)
+        for func, inbox, outbox in stages
+    ]
+    for thread in threads:
+        thread.start()
+
+    error: BaseException | None = None
+    # Writers may finish out of order; hold results until their turn comes up
+    finished: dict[int, tuple[Path, Path]] = {}
+    next_index = 0
+    remaining_writers = writers
+    try:
+        while remaining_writers:
+            item = done_queue.get()
+            if item is _DONE:
+                remaining_writers -= 1
+                continue
+            index, input_file, result = item
+            if isinstance(result, BaseException):
+                error = error or result
+                continue
+            finished[index] = (input_file, result)
+            while error is None and next_index in finished:
+                yield finished.pop(next_index)
+                next_index += 1
+    finally:
+        failed.set()
+        for thread in threads:
+            thread.join()
+
+    if error is not None:
+        raise error
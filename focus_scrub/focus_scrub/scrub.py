@@ -3,11 +3,23 @@ from __future__ import annotations
 from typing import Protocol
 
 import pandas as pd
+import pyarrow as pa
+
+
+# pandas < 3 copies every concatenated column unless told not to; from 3.0
+# copy-on-write makes concat lazy and the copy keyword is deprecated.
+_CONCAT_KWARGS: dict[str, bool] = {"copy": False} if int(pd.__version__.split(".")[0]) < 3 else {}
 
 
 class ColumnHandler(Protocol):
     def scrub(self, value: object) -> object: ...
 
+    def scrub_series(self, series: pd.Series) -> pd.Series: ...
+
+
+# (columns to drop, (index after dropping, column name, handler) per handled column)
+_ScrubPlan = tuple[list[str], tuple[tuple[int, str, ColumnHandler], ...]]
+
 
 class DataFrameScrub:
     """Applies configured handlers per column."""
@@ -22,30 +34,74 @@ class DataFrameScrub:
         self._remove_custom_columns = remove_custom_columns
         # Default to dropping x_Discounts if not specified
         self._drop_columns = drop_columns if drop_columns is not None else ["x_Discounts"]
+        # Column layout -> plan, see _plan
+        self._plans: dict[tuple[str, ...], _ScrubPlan] = {}
 
     def _is_custom_column(self, column_name: str) -> bool:
         """Check if a column is a custom column (x_* or oci_*)."""
         return column_name.startswith("x_") or column_name.startswith("oci_")
 
+    def _columns_to_drop(self, columns: list[str]) -> list[str]:
+        """Return the columns removed by remove_custom_columns and drop_columns."""
+        drop = set(self._drop_columns or ())
+        return [
+            col
+            for col in columns
+            if col in drop or (self._remove_custom_columns and self._is_custom_column(col))
+        ]
+
+    def _plan(self, columns: tuple[str, ...]) -> _ScrubPlan:
+        """Return the columns to drop and the handlers to apply for this column layout.
+
+        Every file and batch of a dataset tends to share one layout, so the plan is
+        worked out once per distinct layout and reused.
+        """
+        plan = self._plans.get(columns)
+        if plan is None:
+            columns_to_drop = self._columns_to_drop(list(columns))
+            dropped = set(columns_to_drop)
+            kept = [col for col in columns if col not in dropped]
+            handled = tuple(
+                (index, col, self._column_handlers[col])
+                for index, col in enumerate(kept)
+                if col in self._column_handlers
+            )
+            plan = self._plans[columns] = (columns_to_drop, handled)
+        return plan
+
     def scrub(self, df: pd.DataFrame) -> pd.DataFrame:
-        result = df.copy()
-
-        # Remove custom columns if requested
-        if self._remove_custom_columns:
-            custom_columns = [col for col in result.columns if self._is_custom_column(col)]
-            if custom_columns:
-                result = result.drop(columns=custom_columns)
-
-        # Drop specific columns if requested
-        if self._drop_columns:
-            columns_to_drop = [col for col in self._drop_columns if col in result.columns]
-            if columns_to_drop:
-                result = result.drop(columns=columns_to_drop)
-
-        # Apply handlers to remaining columns
-        for column_name in result.columns:
-            if column_name not in self._column_handlers:
-                continue
-            handler = self._column_handlers[column_name]
-            result[column_name] = result[column_name].map(handler.scrub)
-        return result
+        """Return a scrubbed frame, leaving *df* untouched.
+
+        The result is assembled column by column so unhandled columns are not
+        deep-copied, with or without pandas copy-on-write.
+        """
+        columns_to_drop, handled = self._plan(tuple(df.columns))
+        scrubbed = {
+            column_name: handler.scrub_series(df[column_name])
+            for _, column_name, handler in handled
+        }
+
+        # Remove custom columns and specific columns if requested
+        dropped = set(columns_to_drop)
+        columns = [
+            scrubbed.get(column_name, series)
+            for column_name, series in df.items()
+            if column_name not in dropped
+        ]
+        if not columns:
+            return df.drop(columns=columns_to_drop)
+        return pd.concat(columns, axis=1, **_CONCAT_KWARGS)
+
+    def scrub_table(self, table: pa.Table) -> pa.Table:
+        """Scrub an Arrow table, converting only the columns that have a handler.
+
+        Columns without a handler are passed through without being copied.
+        """
+        columns_to_drop, handled = self._plan(tuple(table.column_names))
+        if columns_to_drop:
+            table = table.drop_columns(columns_to_drop)
+
+        for index, column_name, handler in handled:
+            scrubbed = handler.scrub_series(table.column(index).to_pandas())
+            table = table.set_column(index, column_name, pa.array(scrubbed, from_pandas=True))
+        return table
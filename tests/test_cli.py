@@ -164,6 +164,60 @@ class TestCLI:
             assert "column_mappings" in mappings_data
             assert "component_mappings" in mappings_data
 
+    def test_cli_rejects_msgpack_mappings_without_package(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test CLI fails before processing when msgpack output is unavailable."""
+        from focus_scrub.cli import main
+
+        monkeypatch.setattr("focus_scrub.mapping.files.msgpack", None)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = Path(tmpdir) / "test.csv"
+            output_dir = Path(tmpdir) / "output"
+            pd.DataFrame({"BillingAccountId": ["123456789012"]}).to_csv(input_file, index=False)
+
+            import sys
+
+            sys.argv = [
+                "focus-scrub",
+                str(input_file),
+                str(output_dir),
+                "--dataset",
+                "CostAndUsage",
+                "--export-mappings",
+                str(Path(tmpdir) / "mappings.msgpack"),
+            ]
+
+            with pytest.raises(SystemExit):
+                main()
+            assert not output_dir.exists()
+
+    def test_cli_skips_empty_mappings_export(self) -> None:
+        """Test CLI does not write a mappings file when nothing was mapped."""
+        from focus_scrub.cli import main
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = Path(tmpdir) / "test.csv"
+            mappings_file = Path(tmpdir) / "mappings.json"
+            # Header only: no values reach the handlers
+            input_file.write_text("BillingAccountId,BillingAccountName\n")
+
+            import sys
+
+            sys.argv = [
+                "focus-scrub",
+                str(input_file),
+                str(Path(tmpdir) / "output"),
+                "--dataset",
+                "CostAndUsage",
+                "--export-mappings",
+                str(mappings_file),
+            ]
+
+            result = main()
+            assert result == 0
+            assert not mappings_file.exists()
+
     def test_cli_with_mappings_load(self) -> None:
         """Test CLI with loading mappings."""
         from focus_scrub.cli import main
@@ -380,6 +434,446 @@ class TestCLI:
             sql_content = output_files[0].read_text()
             assert "my_custom_table" in sql_content
 
+    def test_cli_with_jobs(self) -> None:
+        """Test CLI processing several files concurrently with consistent mappings."""
+        from focus_scrub.cli import main
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_dir = Path(tmpdir) / "input"
+            output_dir = Path(tmpdir) / "output"
+            input_dir.mkdir()
+
+            for i in range(3):
+                df = pd.DataFrame(
+                    {
+                        "BillingAccountId": ["123456789012", f"98765432109{i}"],
+                        "BillingAccountName": ["TestAccount", f"Account{i}"],
+                    }
+                )
+                df.to_csv(input_dir / f"test{i}.csv", index=False)
+
+            import sys
+
+            sys.argv = [
+                "focus-scrub",
+                str(input_dir),
+                str(output_dir),
+                "--dataset",
+                "CostAndUsage",
+                "--jobs",
+                "2",
+            ]
+
+            result = main()
+            assert result == 0
+
+            output_files = sorted(output_dir.rglob("*.parquet"))
+            assert len(output_files) == 3
+
+            # The shared account must map to the same value in every file
+            shared_ids = {pd.read_parquet(f)["BillingAccountId"].iloc[0] for f in output_files}
+            assert len(shared_ids) == 1
+            assert "123456789012" not in shared_ids
+
+    def test_cli_with_jobs_processes_largest_first(self, capsys: pytest.CaptureFixture) -> None:
+        """Test CLI with --jobs schedules the largest files first."""
+        from focus_scrub.cli import main
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_dir = Path(tmpdir) / "input"
+            output_dir = Path(tmpdir) / "output"
+            input_dir.mkdir()
+
+            for name, rows in (("a_small", 1), ("b_large", 100), ("c_medium", 10)):
+                df = pd.DataFrame({"BillingAccountId": ["123456789012"] * rows})
+                df.to_csv(input_dir / f"{name}.csv", index=False)
+
+            import sys
+
+            sys.argv = [
+                "focus-scrub",
+                str(input_dir),
+                str(output_dir),
+                "--dataset",
+                "CostAndUsage",
+                "--jobs",
+                "2",
+            ]
+
+            result = main()
+            assert result == 0
+
+            processed = [
+                line
+                for line in capsys.readouterr().out.splitlines()
+                if line.startswith("Processed")
+            ]
+            order = [Path(line.split()[1]).stem for line in processed]
+            assert order == ["b_large", "c_medium", "a_small"]
+
+    def test_cli_logs_progress_once_per_run(self, capsys: pytest.CaptureFixture) -> None:
+        """Test progress lines are not duplicated when main() runs more than once."""
+        from focus_scrub.cli import logger, main
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = Path(tmpdir) / "test.csv"
+            pd.DataFrame({"BillingAccountId": ["123456789012"]}).to_csv(input_file, index=False)
+
+            import sys
+
+            for run in ("first", "second"):
+                sys.argv = [
+                    "focus-scrub",
+                    str(input_file),
+                    str(Path(tmpdir) / run),
+                    "--dataset",
+                    "CostAndUsage",
+                ]
+                assert main() == 0
+
+                out = capsys.readouterr().out
+                assert out.count("Processed: ") == 1
+                assert "Done. Processed 1 file(s) for dataset 'CostAndUsage'." in out
+
+            assert not logger.handlers
+
+    def test_cli_mirrors_nested_input_directories(self) -> None:
+        """Test CLI creates the output directory tree for nested inputs."""
+        from focus_scrub.cli import main
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_dir = Path(tmpdir) / "input"
+            output_dir = Path(tmpdir) / "output"
+            for relative in ("a/one.csv", "a/two.csv", "b/c/three.csv"):
+                input_file = input_dir / relative
+                input_file.parent.mkdir(parents=True, exist_ok=True)
+                pd.DataFrame({"BillingAccountId": ["123456789012"]}).to_csv(input_file, index=False)
+
+            import sys
+
+            sys.argv = [
+                "focus-scrub",
+                str(input_dir),
+                str(output_dir),
+                "--dataset",
+                "CostAndUsage",
+                "--output-format",
+                "csv-gzip",
+            ]
+
+            result = main()
+            assert result == 0
+            assert (output_dir / "a" / "one.csv.gz").exists()
+            assert (output_dir / "a" / "two.csv.gz").exists()
+            assert (output_dir / "b" / "c" / "three.csv.gz").exists()
+
+    def test_cli_skip_existing(self, capsys: pytest.CaptureFixture) -> None:
+        """Test --skip-existing only reprocesses inputs newer than their outputs."""
+        import os
+
+        from focus_scrub.cli import main
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_dir = Path(tmpdir) / "input"
+            output_dir = Path(tmpdir) / "output"
+            input_dir.mkdir()
+            for name in ("old", "new"):
+                pd.DataFrame({"BillingAccountId": ["123456789012"]}).to_csv(
+                    input_dir / f"{name}.csv", index=False
+                )
+
+            import sys
+
+            sys.argv = [
+                "focus-scrub",
+                str(input_dir),
+                str(output_dir),
+                "--dataset",
+                "CostAndUsage",
+                "--skip-existing",
+            ]
+            assert main() == 0
+            capsys.readouterr()
+
+            # Make "new.csv" newer than its output
+            newer = (output_dir / "new.parquet").stat().st_mtime + 10
+            os.utime(input_dir / "new.csv", (newer, newer))
+
+            assert main() == 0
+            out = capsys.readouterr().out
+            assert f"Skipped (up to date): {input_dir / 'old.csv'}" in out
+            assert f"Processed: {input_dir / 'new.csv'}" in out
+            assert "Done. Processed 1 file(s)" in out
+
+    def test_cli_skip_existing_reprocesses_failed_output(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test --skip-existing reprocesses a file whose previous run failed mid-write."""
+        from focus_scrub.cli import main
+
+        monkeypatch.setattr("focus_scrub.io._CSV_BLOCK_SIZE", 64)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_dir = Path(tmpdir) / "input"
+            output_dir = Path(tmpdir) / "output"
+            input_dir.mkdir()
+            rows = "\n".join(f"123456789012,{i}" for i in range(100))
+            (input_dir / "a.csv").write_text(f"BillingAccountId,Cost\n{rows}\n123456789012,abc\n")
+
+            import sys
+
+            args = ["focus-scrub", str(input_dir), str(output_dir), "--dataset", "CostAndUsage"]
+            sys.argv = [*args, "--skip-existing", "--stream", "--chunk-size", "10"]
+            with pytest.raises(SystemExit):
+                main()
+            capsys.readouterr()
+
+            # The same file scrubs fine when read whole
+            sys.argv = [*args, "--skip-existing"]
+            assert main() == 0
+            out = capsys.readouterr().out
+            assert "Skipped" not in out
+            assert f"Processed: {input_dir / 'a.csv'}" in out
+            assert len(pd.read_parquet(output_dir / "a.parquet")) == 101
+
+    def test_cli_progress_not_duplicated_by_root_logging(
+        self, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test progress lines skip root handlers and the logger is restored afterwards."""
+        import logging
+        import sys
+
+        from focus_scrub.cli import logger, main
+
+        root = logging.getLogger()
+        root_handler = logging.StreamHandler(sys.stdout)
+        root.addHandler(root_handler)
+        try:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                input_dir = Path(tmpdir) / "input"
+                input_dir.mkdir()
+                pd.DataFrame({"BillingAccountId": ["123456789012"]}).to_csv(
+                    input_dir / "test.csv", index=False
+                )
+
+                sys.argv = [
+                    "focus-scrub",
+                    str(input_dir),
+                    str(Path(tmpdir) / "output"),
+                    "--dataset",
+                    "CostAndUsage",
+                ]
+                assert main() == 0
+        finally:
+            root.removeHandler(root_handler)
+
+        assert capsys.readouterr().out.count("Processed:") == 1
+        assert logger.propagate
+        assert logger.level == logging.NOTSET
+
+    def test_cli_processes_symlinked_duplicate_once(self, capsys: pytest.CaptureFixture) -> None:
+        """Test a file that is also reachable through a symlink is scrubbed once."""
+        from focus_scrub.cli import main
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_dir = Path(tmpdir) / "input"
+            input_dir.mkdir()
+            pd.DataFrame({"BillingAccountId": ["123456789012"]}).to_csv(
+                input_dir / "2024-01.csv", index=False
+            )
+            (input_dir / "latest.csv").symlink_to(input_dir / "2024-01.csv")
+
+            import sys
+
+            sys.argv = [
+                "focus-scrub",
+                str(input_dir),
+                str(Path(tmpdir) / "output"),
+                "--dataset",
+                "CostAndUsage",
+            ]
+
+            assert main() == 0
+            out = capsys.readouterr().out
+            assert "Done. Processed 1 file(s)" in out
+            assert "latest.csv" not in out
+
+    def test_cli_parquet_tuning_options(self) -> None:
+        """Test --jobs 0, --compression and --row-group-size are applied to the output."""
+        import pyarrow.parquet as pq
+        from focus_scrub.cli import main
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_dir = Path(tmpdir) / "input"
+            output_dir = Path(tmpdir) / "output"
+            input_dir.mkdir()
+            for name in ("a", "b"):
+                df = pd.DataFrame({"BillingAccountId": ["123456789012"] * 10})
+                df.to_csv(input_dir / f"{name}.csv", index=False)
+
+            import sys
+
+            sys.argv = [
+                "focus-scrub",
+                str(input_dir),
+                str(output_dir),
+                "--dataset",
+                "CostAndUsage",
+                "--jobs",
+                "0",
+                "--compression",
+                "snappy",
+                "--row-group-size",
+                "4",
+            ]
+
+            result = main()
+            assert result == 0
+
+            for name in ("a", "b"):
+                metadata = pq.ParquetFile(output_dir / f"{name}.parquet").metadata
+                assert metadata.num_row_groups == 3
+                assert metadata.row_group(0).column(0).compression == "SNAPPY"
+
+    def test_cli_invalid_jobs(self) -> None:
+        """Test CLI rejects a negative job count."""
+        from focus_scrub.cli import main
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_dir = Path(tmpdir) / "input"
+            output_dir = Path(tmpdir) / "output"
+            input_dir.mkdir()
+            pd.DataFrame({"BillingAccountId": ["123456789012"]}).to_csv(
+                input_dir / "test.csv", index=False
+            )
+
+            import sys
+
+            sys.argv = [
+                "focus-scrub",
+                str(input_dir),
+                str(output_dir),
+                "--dataset",
+                "CostAndUsage",
+                "--jobs",
+                "-1",
+            ]
+
+            with pytest.raises(SystemExit):
+                main()
+
+    def test_cli_with_stream(self) -> None:
+        """Test CLI streaming files in batches."""
+        from focus_scrub.cli import main
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_dir = Path(tmpdir) / "input"
+            output_dir = Path(tmpdir) / "output"
+            input_dir.mkdir()
+
+            df = pd.DataFrame(
+                {
+                    "BillingAccountId": ["123456789012", "987654321098"] * 5,
+                    "BillingAccountName": ["TestAccount", "OtherAccount"] * 5,
+                }
+            )
+            df.to_parquet(input_dir / "test.parquet", index=False)
+
+            import sys
+
+            sys.argv = [
+                "focus-scrub",
+                str(input_dir),
+                str(output_dir),
+                "--dataset",
+                "CostAndUsage",
+                "--stream",
+                "--chunk-size",
+                "3",
+            ]
+
+            result = main()
+            assert result == 0
+
+            df_out = pd.read_parquet(output_dir / "test.parquet")
+            assert len(df_out) == 10
+            # Mappings stay consistent across batches
+            assert df_out["BillingAccountId"].nunique() == 2
+            assert "123456789012" not in df_out["BillingAccountId"].values
+
+    def test_cli_stream_failure_leaves_no_output(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test a CSV failing mid-stream is reported as an error and writes no output."""
+        from focus_scrub.cli import main
+
+        monkeypatch.setattr("focus_scrub.io._CSV_BLOCK_SIZE", 64)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_dir = Path(tmpdir) / "input"
+            output_dir = Path(tmpdir) / "output"
+            input_dir.mkdir()
+            rows = "\n".join(f"123456789012,{i}" for i in range(100))
+            (input_dir / "test.csv").write_text(
+                f"BillingAccountId,Cost\n{rows}\n123456789012,abc\n"
+            )
+
+            import sys
+
+            sys.argv = [
+                "focus-scrub",
+                str(input_dir),
+                str(output_dir),
+                "--dataset",
+                "CostAndUsage",
+                "--stream",
+                "--chunk-size",
+                "10",
+            ]
+
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+            assert exc_info.value.code == 2
+            assert "without --stream" in capsys.readouterr().err
+            assert list(output_dir.rglob("*")) == []
+
+    def test_cli_stream_rejects_sql_output(self) -> None:
+        """Test CLI rejects --stream with SQL output."""
+        from focus_scrub.cli import main
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_dir = Path(tmpdir) / "input"
+            output_dir = Path(tmpdir) / "output"
+            input_dir.mkdir()
+            pd.DataFrame({"BillingAccountId": ["123456789012"]}).to_csv(
+                input_dir / "test.csv", index=False
+            )
+
+            import sys
+
+            sys.argv = [
+                "focus-scrub",
+                str(input_dir),
+                str(output_dir),
+                "--dataset",
+                "CostAndUsage",
+                "--stream",
+                "--output-format",
+                "sql",
+            ]
+
+            with pytest.raises(SystemExit):
+                main()
+
+    def test_cli_import_does_not_load_pandas(self) -> None:
+        """Test importing the CLI and building the parser stays free of heavy imports."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys; from focus_scrub.cli import build_parser; build_parser(); "
+            "assert 'pandas' not in sys.modules and 'pyarrow' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
     def test_cli_no_input_files(self) -> None:
         """Test CLI with no input files."""
         from focus_scrub.cli import main
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import json
+
+import numpy as np
 import pandas as pd
+import pytest
 from focus_scrub.handlers import (
     AccountIdHandler,
     CommitmentDiscountIdHandler,
+    HandlerConfig,
     ResourceIdHandler,
     StellarNameHandler,
     TagsHandler,
     UnmappedScrambleStringHandler,
+    get_column_handlers_for_dataset,
 )
 from focus_scrub.mapping import MappingCollector, MappingEngine
 
@@ -63,6 +69,33 @@ class TestAccountIdHandler:
         # Account ID in ARN should match standalone mapping
         assert mapped_account in mapped_arn
 
+    def test_mixed_components_mapped_once(self, mapping_engine: MappingEngine) -> None:
+        """Test each UUID, profile code and account ID in a value maps through its engine map."""
+        handler = AccountIdHandler(mapping_engine=mapping_engine)
+
+        # The UUID's last segment is 12 digits and must not be mapped as an account ID
+        uuid_str = "00000000-1111-2222-3333-444455556666"
+        value = f"{uuid_str}/JW5R-JYGR-BG7-PGB/123456789012"
+        result = handler.scrub(value)
+
+        assert result == "/".join(
+            [
+                mapping_engine.map_uuid(uuid_str),
+                mapping_engine.map_profile_code("JW5R-JYGR-BG7-PGB"),
+                mapping_engine.map_number_id("123456789012"),
+            ]
+        )
+        assert "444455556666" not in mapping_engine._number_id_map
+
+    @pytest.mark.parametrize("value", ["ri-1", "acct", "ABC-DEF-GH", "ABCDEFGHIJK"])
+    def test_short_opaque_values_map_to_uuids(
+        self, value: str, mapping_engine: MappingEngine
+    ) -> None:
+        """Test values too short to hold an account ID or profile code map as opaque strings."""
+        handler = AccountIdHandler(mapping_engine=mapping_engine)
+
+        assert handler.scrub(value) == mapping_engine.map_uuid(value)
+
     def test_na_values_passed_through(self, mapping_engine: MappingEngine) -> None:
         """Test that NA values are passed through unchanged."""
         handler = AccountIdHandler(mapping_engine=mapping_engine)
@@ -85,7 +118,7 @@ class TestAccountIdHandler:
         mappings = collector.to_dict()
         assert "TestColumn" in mappings
         assert len(mappings["TestColumn"]) == 1
-        assert mappings["TestColumn"][0] == (original, result)
+        assert mappings["TestColumn"] == {original: result}
 
 
 class TestStellarNameHandler:
@@ -153,6 +186,16 @@ class TestCommitmentDiscountIdHandler:
 
         assert account_result == commitment_result
 
+    def test_shared_replacements_are_one_object(self, mapping_engine: MappingEngine) -> None:
+        """Test handlers sharing an engine return the engine's stored replacement itself."""
+        account_handler = AccountIdHandler(mapping_engine=mapping_engine)
+        commitment_handler = CommitmentDiscountIdHandler(mapping_engine=mapping_engine)
+
+        account_result = account_handler.scrub("333344445555")
+
+        assert commitment_handler.scrub("333344445555") is account_result
+        assert mapping_engine.get_all_mappings()["NumberId"]["333344445555"] == account_result
+
 
 class TestResourceIdHandler:
     """Test the ResourceIdHandler."""
@@ -205,6 +248,20 @@ class TestResourceIdHandler:
         # Should preserve slash structure in resource path
         assert "/" in result
 
+    def test_aws_arn_with_repeated_uuid(self, mapping_engine: MappingEngine) -> None:
+        """Test a UUID repeated in an ARN resource is mapped the same way each time."""
+        handler = ResourceIdHandler(mapping_engine=mapping_engine)
+
+        uuid_str = "abc12345-6789-abcd-ef01-234567890abc"
+        arn = f"arn:aws:ecs:us-east-1:123456789012:task/{uuid_str}/{uuid_str}:{uuid_str}"
+        result = handler.scrub(arn)
+
+        resource = result.split(":", 5)[5]
+        first, second = resource.split("/")[1:]
+        assert uuid_str not in result
+        assert second == f"{first}:{first}"
+        assert list(mapping_engine._uuid_map) == [uuid_str]
+
     def test_azure_resource_id_scrubbing(self, mapping_engine: MappingEngine) -> None:
         """Test scrubbing Azure Resource IDs."""
         handler = ResourceIdHandler(mapping_engine=mapping_engine)
@@ -238,6 +295,23 @@ class TestResourceIdHandler:
         # Structure maintained
         assert result.count("/") == resource_id.count("/")
 
+    def test_azure_resource_name_with_uuids(self, mapping_engine: MappingEngine) -> None:
+        """Test every UUID embedded in an Azure resource name is mapped in place."""
+        handler = ResourceIdHandler(mapping_engine=mapping_engine)
+
+        uuid1 = "abc12345-6789-abcd-ef01-234567890abc"
+        uuid2 = "ABC12345-6789-ABCD-EF01-234567890DEF"
+        resource_id = (
+            f"/subscriptions/{uuid1}/resourcegroups/rg/providers/microsoft.compute/disks/"
+            f"osdisk-{uuid1}{uuid2}_{uuid1}-1234-5678"
+        )
+        result = handler.scrub(resource_id)
+
+        mapped1 = mapping_engine.map_uuid(uuid1)
+        mapped2 = mapping_engine.map_uuid(uuid2)
+        assert result.startswith(f"/subscriptions/{mapped1}/resourcegroups/")
+        assert result.endswith(f"/osdisk-{mapped1}{mapped2}_{mapped1}-1234-5678")
+
     def test_oci_ocid_scrubbing(self, mapping_engine: MappingEngine) -> None:
         """Test scrubbing OCI OCIDs."""
         handler = ResourceIdHandler(mapping_engine=mapping_engine)
@@ -336,10 +410,45 @@ class TestResourceIdHandler:
         assert original in dict(mappings["ResourceId"])
         assert dict(mappings["ResourceId"])[original] == result
 
+    def test_cached_results_recorded_to_new_collector(
+        self, mapping_engine: MappingEngine, mapping_collector: MappingCollector
+    ) -> None:
+        """Test values seen before a collector is attached are still recorded to it."""
+        handler = ResourceIdHandler(mapping_engine=mapping_engine)
+
+        original = "arn:aws:s3:::my-test-bucket-name"
+        result = handler.scrub(original)
+        handler.attach_collector("ResourceId", mapping_collector)
+
+        assert handler.scrub(original) == result
+        assert mapping_collector.to_dict() == {"ResourceId": {original: result}}
+
 
 class TestTagsHandler:
     """Test the TagsHandler."""
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_rejected_by_orjson_is_still_scrubbed(
+        self, use_orjson: bool, mapping_engine: MappingEngine, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test JSON that only the standard library parses is scrubbed, not passed through."""
+        if not use_orjson:
+            monkeypatch.setattr("focus_scrub.handlers.orjson", None)
+        handler = TagsHandler(mapping_engine=mapping_engine)
+
+        result = handler.scrub('{"owner":"alice\\ud800"}')
+
+        assert "alice" not in result
+        assert json.loads(result)["owner"][-1] == "\ud800"
+
+    def test_json_wide_integers_parsed_exactly(self) -> None:
+        """Test tag JSON with integers wider than 64 bits parses like json.loads."""
+        from focus_scrub.handlers import _load_json
+
+        value = '{"owner":"alice","id":123456789012345678901234567890}'
+
+        assert _load_json(value) == json.loads(value)
+
     def test_aws_format_scrubbing(self, mapping_engine: MappingEngine) -> None:
         """Test scrubbing AWS format tags (list of tuples)."""
         handler = TagsHandler(mapping_engine=mapping_engine)
@@ -362,6 +471,26 @@ class TestTagsHandler:
         assert result.startswith("[")
         assert result.endswith("]")
 
+    @pytest.mark.parametrize(
+        "tags",
+        [
+            "[('env', 'production')]",
+            "[('owner', \"O'Brien\"), ('path', 'C:\\\\tmp')]",
+            "[('env','production'),('team','backend')]",
+        ],
+    )
+    def test_aws_format_matches_literal_eval(self, tags: str) -> None:
+        """Test AWS tag strings scrub as if parsed with ast.literal_eval, quoting included."""
+        import ast
+
+        handler = TagsHandler(mapping_engine=MappingEngine())
+        result = handler.scrub(tags)
+
+        expected = [
+            (key, handler.mapping_engine.scramble(val)) for key, val in ast.literal_eval(tags)
+        ]
+        assert result == str(expected)
+
     def test_json_format_scrubbing(self, mapping_engine: MappingEngine) -> None:
         """Test scrubbing JSON format tags (Azure/OCI)."""
         handler = TagsHandler(mapping_engine=mapping_engine)
@@ -434,6 +563,16 @@ class TestTagsHandler:
 
         assert prod_value1 == prod_value2, "Same value should scramble consistently"
 
+    def test_value_consistency_with_resource_ids(self, mapping_engine: MappingEngine) -> None:
+        """Test a tag value scrambles the same as the resource name it refers to."""
+        tags_handler = TagsHandler(mapping_engine=mapping_engine)
+        resource_handler = ResourceIdHandler(mapping_engine=mapping_engine)
+
+        scrubbed_tags = tags_handler.scrub('{"Name":"web-server-01"}')
+        scrubbed_resource = resource_handler.scrub("web-server-01")
+
+        assert scrubbed_tags == f'{{"Name":"{scrubbed_resource}"}}'
+
     def test_preserves_key_structure(self, mapping_engine: MappingEngine) -> None:
         """Test that keys with special characters are preserved."""
         handler = TagsHandler(mapping_engine=mapping_engine)
@@ -659,3 +798,141 @@ class TestUnmappedScrambleStringHandler:
 
         assert pd.isna(handler.scrub(pd.NA))
         assert pd.isna(handler.scrub(None))
+
+
+class TestGetColumnHandlersForDataset:
+    """Test building column handlers for a dataset."""
+
+    def test_unknown_dataset_raises_error(self) -> None:
+        """Test that an unknown dataset name raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown dataset 'Nope'"):
+            get_column_handlers_for_dataset("Nope", config=HandlerConfig())
+
+    def test_handlers_are_built_per_call(self) -> None:
+        """Test that repeated calls return fresh handlers bound to their own engine."""
+        config = HandlerConfig()
+        handlers1, engine1 = get_column_handlers_for_dataset("CostAndUsage", config=config)
+        handlers2, engine2 = get_column_handlers_for_dataset("CostAndUsage", config=config)
+
+        assert handlers1.keys() == handlers2.keys()
+        assert engine1 is not engine2
+        assert handlers1["BillingAccountId"] is not handlers2["BillingAccountId"]
+
+    def test_dates_only_keeps_date_handlers(self) -> None:
+        """Test that dates_only mode only builds DateReformat handlers."""
+        handlers, _ = get_column_handlers_for_dataset(
+            "CostAndUsage", config=HandlerConfig(dates_only=True)
+        )
+
+        assert set(handlers) == {
+            "BillingPeriodStart",
+            "BillingPeriodEnd",
+            "ChargePeriodStart",
+            "ChargePeriodEnd",
+        }
+
+
+class TestScrubSeries:
+    """Test that whole-column scrubbing matches scrubbing value by value."""
+
+    SERIES = {
+        "AccountId": pd.Series(
+            ["123456789012", None, "arn:aws:iam::123456789012:role/x", "123456789012", " 1 "]
+        ),
+        "StellarName": pd.Series(["Acme", "Globex", None, "Acme", " Acme "]),
+        # Opaque IDs map to uuid4 values, which random.seed does not control
+        "CommitmentDiscountId": pd.Series(["123456789012", None, "123456789012"]),
+        "ResourceId": pd.Series(
+            ["i-0abc123", "arn:aws:s3:::bucket/key", pd.NA, "i-0abc123"], dtype=object
+        ),
+        "Tags": pd.Series(
+            ['{"env":"prod"}', [("team", "alpha")], None, '{"env":"prod"}', {"k": "v"}],
+            dtype=object,
+        ),
+        "UnmappedScrambleString": pd.Series(["ABCD-1234", None, "ABCD-1234"]),
+        "DateReformat": pd.Series(["2024-01-01T00:00:00Z", None, "not a date", "2024-01-01"]),
+        "DateReformatTimestamps": pd.to_datetime(
+            pd.Series(["2024-01-01", None, "2024-01-01"]), utc=True
+        ),
+        "DateReformatNaive": pd.to_datetime(
+            pd.Series(["2024-01-01 10:00:00.250", None, "1960-06-01 00:00:00.000001"])
+        ).dt.as_unit("ns"),
+        "Integers": pd.Series([111111111111, 222222222222, 111111111111]),
+    }
+
+    @pytest.mark.parametrize("series_name", list(SERIES))
+    def test_matches_map(self, series_name: str) -> None:
+        """Test scrub_series gives the same values, dtype and mappings as Series.map."""
+        import random
+
+        from focus_scrub.handlers import HANDLER_FACTORIES
+
+        handler_name = {
+            "DateReformatTimestamps": "DateReformat",
+            "DateReformatNaive": "DateReformat",
+            "Integers": "AccountId",
+        }.get(series_name, series_name)
+        series = self.SERIES[series_name]
+        config = HandlerConfig(date_shift_days=3)
+
+        results = []
+        for scrub in ("map", "scrub_series"):
+            random.seed(1234)
+            collector = MappingCollector()
+            handler = HANDLER_FACTORIES[handler_name](config, MappingEngine())
+            handler.attach_collector("Column", collector)
+            if scrub == "map":
+                scrubbed = series.map(handler.scrub)
+            else:
+                scrubbed = handler.scrub_series(series)
+            results.append((scrubbed, collector.to_dict()))
+
+        (expected, expected_mappings), (actual, actual_mappings) = results
+        pd.testing.assert_series_equal(actual, expected)
+        assert actual_mappings == expected_mappings
+
+    @pytest.mark.parametrize(
+        "value",
+        [None, float("nan"), np.float32("nan"), pd.NA, pd.NaT, np.datetime64("NaT")],
+    )
+    def test_scalar_nulls_passed_through(self, value: object) -> None:
+        """Test every handler's scalar scrub returns the nulls pd.isna recognizes unchanged."""
+        from focus_scrub.handlers import HANDLER_FACTORIES
+
+        for factory in HANDLER_FACTORIES.values():
+            handler = factory(HandlerConfig(date_shift_days=3), MappingEngine())
+            assert handler.scrub(value) is value
+
+    @pytest.mark.parametrize("handler_name", ["AccountId", "StellarName", "ResourceId"])
+    def test_mixed_types_match_scalar_scrub(self, handler_name: str) -> None:
+        """Test values that compare equal across types (1, 1.0, True) are scrubbed apart."""
+        from focus_scrub.handlers import HANDLER_FACTORIES
+
+        handler = HANDLER_FACTORIES[handler_name](HandlerConfig(), MappingEngine())
+        series = pd.Series([1, 1.0, True, "1", 1, None], dtype=object)
+
+        scrubbed = handler.scrub_series(series)
+
+        # The scalar calls hit the same engine, so they must agree value for value
+        assert scrubbed.tolist()[:5] == [handler.scrub(value) for value in series[:5]]
+        assert len(set(scrubbed[:4])) == len({"1", "1.0", "True"})
+
+    def test_all_null_series_keeps_dtype(self) -> None:
+        """Test a column with only nulls comes back with its dtype, not one inferred from NaN."""
+        from focus_scrub.handlers import HANDLER_FACTORIES
+
+        series = pd.Series([None, None], dtype="string")
+        for factory in HANDLER_FACTORIES.values():
+            handler = factory(HandlerConfig(date_shift_days=3), MappingEngine())
+            assert handler.scrub_series(series).dtype == series.dtype
+
+    def test_preserves_index_and_name(self, mapping_engine: MappingEngine) -> None:
+        """Test the scrubbed series keeps the input index and name."""
+        handler = StellarNameHandler(mapping_engine=mapping_engine)
+        series = pd.Series(["Acme", None], index=[10, 20], name="BillingAccountName")
+
+        result = handler.scrub_series(series)
+
+        assert list(result.index) == [10, 20]
+        assert result.name == "BillingAccountName"
+        assert pd.isna(result[20])
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+from collections import Counter
+
 import pandas as pd
+import pyarrow as pa
+import pytest
 from focus_scrub.handlers import HandlerConfig, get_column_handlers_for_dataset
-from focus_scrub.mapping import MappingCollector
+from focus_scrub.mapping import MappingCollector, engine
 from focus_scrub.scrub import DataFrameScrub
 
 
@@ -100,6 +104,90 @@ class TestIntegration:
         assert "SubAccountId" in mappings
         assert "BillingAccountName" in mappings
 
+    def test_scrub_is_column_wise(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test scrub calls each handler's scrub_series once and never scrubs per cell."""
+        column_handlers, _ = get_column_handlers_for_dataset("CostAndUsage", config=HandlerConfig())
+        df = pd.DataFrame(
+            {
+                "BillingAccountId": ["000011112222", "000011112222", "555566667777"],
+                "BillingAccountName": ["Company A", "Company A", "Company B"],
+                "ChargePeriodStart": ["2024-01-01T00:00:00"] * 3,
+                "ResourceId": ["i-0123456789abcdef0", pd.NA, "i-0123456789abcdef0"],
+            }
+        )
+        calls: Counter[str] = Counter()
+
+        def scrub_cell(self: object, value: object) -> object:
+            raise AssertionError(f"{type(self).__name__}.scrub called for {value!r}")
+
+        for handler_type in {type(column_handlers[column]) for column in df.columns}:
+            monkeypatch.setattr(handler_type, "scrub", scrub_cell)
+
+            def counted(
+                self: object, series: pd.Series, _wrapped=handler_type.scrub_series
+            ) -> pd.Series:
+                calls[str(series.name)] += 1
+                return _wrapped(self, series)
+
+            monkeypatch.setattr(handler_type, "scrub_series", counted)
+
+        DataFrameScrub(column_handlers=column_handlers).scrub(df)
+
+        assert calls == dict.fromkeys(df.columns, 1)
+
+    def test_repeated_values_generated_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a column with many repeats generates one replacement per distinct value."""
+        generated: list[int] = []
+        random_digits = engine._random_digits
+
+        def counted(length: int) -> str:
+            generated.append(length)
+            return random_digits(length)
+
+        monkeypatch.setattr(engine, "_random_digits", counted)
+        account_ids = [f"{n:012d}" for n in range(1, 6)]
+        df = pd.DataFrame({"BillingAccountId": account_ids * 200})
+        column_handlers, _ = get_column_handlers_for_dataset("CostAndUsage", config=HandlerConfig())
+
+        result = DataFrameScrub(column_handlers=column_handlers).scrub(df)
+
+        assert len(generated) == 5
+        assert result["BillingAccountId"].nunique() == 5
+
+    def test_large_frame_scrubs_each_distinct_value_once(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a 100k-row frame is scrubbed with one handler call per distinct value."""
+        rows = 100_000
+        account_ids = [f"{n:012d}" for n in range(1, 51)]
+        df = pd.DataFrame(
+            {
+                "BillingAccountId": (account_ids * (rows // 50))[:rows],
+                "BillingAccountName": [f"Account {n % 20}" for n in range(rows)],
+                "ChargePeriodStart": [f"2024-01-{n % 31 + 1:02d}T00:00:00" for n in range(rows)],
+                "ResourceId": [f"i-{n % 40:017x}" for n in range(rows)],
+            }
+        )
+        column_handlers, _ = get_column_handlers_for_dataset("CostAndUsage", config=HandlerConfig())
+        calls: Counter[str] = Counter()
+
+        for handler_type in {type(column_handlers[column]) for column in df.columns}:
+
+            def counted(self: object, value: object, _wrapped=handler_type._scrub_one) -> object:
+                calls[type(self).__name__] += 1
+                return _wrapped(self, value)
+
+            monkeypatch.setattr(handler_type, "_scrub_one", counted)
+
+        DataFrameScrub(column_handlers=column_handlers).scrub(df)
+
+        assert calls == {
+            type(column_handlers["BillingAccountId"]).__name__: 50,
+            type(column_handlers["BillingAccountName"]).__name__: 20,
+            type(column_handlers["ChargePeriodStart"]).__name__: 31,
+            type(column_handlers["ResourceId"]).__name__: 40,
+        }
+
     def test_account_id_consistency_across_columns(self) -> None:
         """Test that same account ID maps consistently across different columns."""
         # Create test data where SubAccountId value appears in CommitmentDiscountId ARN
@@ -173,6 +261,33 @@ class TestIntegration:
         # Verify that the same account ID gets the same mapping
         assert result1["BillingAccountId"][0] == result2["BillingAccountId"][0]
 
+    def test_loaded_mappings_generate_no_new_values(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test scrubbing values already in a loaded mapping never generates replacements."""
+        df = pd.DataFrame(
+            {
+                "BillingAccountId": ["111111111111", "888888888888", "111111111111"],
+                "SubAccountId": ["222222222222", "222222222222", "999999999999"],
+            }
+        )
+        config = HandlerConfig(date_shift_days=0)
+        column_handlers1, mapping_engine1 = get_column_handlers_for_dataset(
+            "CostAndUsage", config=config
+        )
+        result1 = DataFrameScrub(column_handlers=column_handlers1).scrub(df)
+
+        column_handlers2, mapping_engine2 = get_column_handlers_for_dataset(
+            "CostAndUsage", config=config
+        )
+        mapping_engine2.load_mappings(mapping_engine1.get_all_mappings())
+
+        def generate(length: int) -> str:
+            raise AssertionError("replacement generated for an already-mapped value")
+
+        monkeypatch.setattr("focus_scrub.mapping.engine._random_digits", generate)
+        result2 = DataFrameScrub(column_handlers=column_handlers2).scrub(df)
+
+        pd.testing.assert_frame_equal(result1, result2)
+
     def test_drop_columns_defaults_to_x_discounts(self) -> None:
         """Test that x_Discounts is dropped by default."""
         df = pd.DataFrame(
@@ -454,3 +569,62 @@ class TestIntegration:
 
         # Dates should be shifted
         assert result["BillingPeriodStart"][0] != "2024-01-01T00:00:00Z"
+
+    def test_scrub_table_matches_scrub(self) -> None:
+        """Test scrubbing an Arrow table gives the same result as scrubbing a DataFrame."""
+        df = pd.DataFrame(
+            {
+                "BillingAccountId": ["111111111111", "222222222222"],
+                "BillingAccountName": ["Company A", None],
+                "BillingPeriodStart": ["2024-01-01T00:00:00Z", "2024-02-01T00:00:00Z"],
+                "BilledCost": [1.5, None],
+                "x_Discounts": ["discount1", "discount2"],
+            }
+        )
+
+        config = HandlerConfig(date_shift_days=30)
+        column_handlers, _ = get_column_handlers_for_dataset("CostAndUsage", config=config)
+        scrub = DataFrameScrub(column_handlers=column_handlers)
+
+        expected = scrub.scrub(df)
+        # The shared mapping engine maps the same inputs to the same outputs again
+        result = scrub.scrub_table(pa.Table.from_pandas(df, preserve_index=False))
+
+        assert result.column_names == list(expected.columns)
+        pd.testing.assert_frame_equal(result.to_pandas(), expected, check_dtype=False)
+
+    def test_scrub_handles_changing_column_layouts(self) -> None:
+        """Test one DataFrameScrub scrubs frames whose columns differ or are reordered."""
+        config = HandlerConfig()
+        column_handlers, mapping_engine = get_column_handlers_for_dataset(
+            "CostAndUsage", config=config
+        )
+        scrub = DataFrameScrub(column_handlers=column_handlers)
+
+        first = scrub.scrub(
+            pd.DataFrame({"BillingAccountId": ["111111111111"], "x_Discounts": ["d"]})
+        )
+        second = scrub.scrub(
+            pd.DataFrame({"BilledCost": [1.5], "BillingAccountId": ["111111111111"]})
+        )
+        third = scrub.scrub_table(
+            pa.table({"x_Discounts": ["d"], "BilledCost": [2.5], "BillingAccountId": ["1"]})
+        )
+
+        mapped = mapping_engine.map_number_id("111111111111")
+        assert first.to_dict("list") == {"BillingAccountId": [mapped]}
+        assert second.to_dict("list") == {"BilledCost": [1.5], "BillingAccountId": [mapped]}
+        assert third.column_names == ["BilledCost", "BillingAccountId"]
+        assert third.column("BillingAccountId").to_pylist() == [mapping_engine.map_number_id("1")]
+
+    def test_scrub_leaves_input_frame_unchanged(self) -> None:
+        """Test scrubbing returns a new frame and does not modify the input."""
+        column_handlers, _ = get_column_handlers_for_dataset("CostAndUsage", config=HandlerConfig())
+        scrub = DataFrameScrub(column_handlers=column_handlers, drop_columns=[])
+        df = pd.DataFrame({"BillingAccountId": ["111111111111"], "BilledCost": [1.5]})
+
+        result = scrub.scrub(df)
+        result.loc[0, "BilledCost"] = 9.0
+
+        assert result["BillingAccountId"][0] != "111111111111"
+        assert df.to_dict("list") == {"BillingAccountId": ["111111111111"], "BilledCost": [1.5]}
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 
 import pandas as pd
@@ -10,9 +11,14 @@ import pytest
 from focus_scrub.io import (
     FileFormat,
     discover_focus_files,
+    get_focus_file_writer,
     output_path_for_file,
     read_focus_file,
+    read_focus_file_batches,
+    read_focus_table,
     write_focus_file,
+    write_focus_file_batches,
+    write_focus_table,
 )
 
 
@@ -127,6 +133,43 @@ class TestReadFocusFile:
             assert df.shape == (2, 2)
             assert list(df.columns) == ["col1", "col2"]
 
+    def test_read_csv_matches_pandas(self) -> None:
+        """Test the Arrow CSV reader keeps dates as strings and nulls as pandas does."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "test.csv"
+            test_file.write_text(
+                "Id,ChargePeriodStart,BillingPeriod,Name,Cost\n"
+                "123456789012,2024-01-01T00:00:00Z,2024-01-01,x,1.5\n"
+                "210987654321,2024-01-02T00:00:00Z,2024-01-02,,\n"
+            )
+
+            df = read_focus_file(test_file)
+            pd.testing.assert_frame_equal(df, pd.read_csv(test_file, low_memory=False))
+            assert df["ChargePeriodStart"].iloc[0] == "2024-01-01T00:00:00Z"
+
+    def test_read_csv_falls_back_on_late_type_change(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a column whose type changes after the first block is still read."""
+        monkeypatch.setattr("focus_scrub.io._CSV_BLOCK_SIZE", 64)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "test.csv"
+            rows = "\n".join(str(i) for i in range(100))
+            test_file.write_text(f"col1\n{rows}\nnot-a-number\n")
+
+            df = read_focus_file(test_file)
+            assert len(df) == 101
+            assert df["col1"].iloc[-1] == "not-a-number"
+
+    def test_read_csv_keeps_late_dates_as_strings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test dates first seen after the schema probe's block are still strings."""
+        monkeypatch.setattr("focus_scrub.io._CSV_BLOCK_SIZE", 64)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "test.csv"
+            rows = "\n".join(f"{i}," for i in range(100))
+            test_file.write_text(f"col1,col2\n{rows}\n100,2024-01-01\n")
+
+            df = read_focus_file(test_file)
+            assert df["col2"].iloc[-1] == "2024-01-01"
+
     def test_read_parquet_file(self) -> None:
         """Test reading a parquet file."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -233,6 +276,19 @@ class TestWriteFocusFile:
             df_read = pd.read_parquet(output_file)
             assert df_read.shape == (2, 2)
 
+    def test_write_parquet_uses_zstd(self) -> None:
+        """Test parquet output is zstd-compressed."""
+        import pyarrow.parquet as pq
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_file = Path(tmpdir) / "output.parquet"
+            df = pd.DataFrame({"col1": [1, 2], "col2": ["a", "b"]})
+
+            write_focus_file(df, output_file, FileFormat.PARQUET)
+
+            metadata = pq.ParquetFile(output_file).metadata
+            assert metadata.row_group(0).column(0).compression == "ZSTD"
+
     def test_write_creates_parent_directory(self) -> None:
         """Test that write_focus_file creates parent directories."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -244,6 +300,251 @@ class TestWriteFocusFile:
             assert output_file.exists()
             assert output_file.parent.exists()
 
+    def test_get_focus_file_writer(self) -> None:
+        """Test resolving a writer once and reusing it for several files."""
+        writer = get_focus_file_writer(FileFormat.CSV_GZIP)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ("a", "b"):
+                output_file = Path(tmpdir) / f"{name}.csv.gz"
+                writer(pd.DataFrame({"col1": [1]}), output_file, None)
+                assert pd.read_csv(output_file).shape == (1, 1)
+
+    def test_failed_write_leaves_no_partial_output(self) -> None:
+        """Test a writer failing part way through leaves no output file behind."""
+
+        class Unprintable:
+            def __str__(self) -> str:
+                raise RuntimeError("cannot render")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_file = Path(tmpdir) / "output.sql"
+            df = pd.DataFrame({"col1": [Unprintable()]})
+
+            with pytest.raises(RuntimeError, match="cannot render"):
+                write_focus_file(df, output_file, FileFormat.SQL)
+            assert list(Path(tmpdir).iterdir()) == []
+
+    def test_get_focus_file_writer_unsupported_format(self) -> None:
+        """Test an unknown output format raises ValueError."""
+        with pytest.raises(ValueError, match="Unsupported output format"):
+            get_focus_file_writer("xml")  # type: ignore[arg-type]
+
+
+class TestArrowTableIO:
+    """Test reading and writing FOCUS files as Arrow tables."""
+
+    def test_read_parquet_table_keeps_arrow_types(self) -> None:
+        """Test parquet is read without a pandas round trip turning int64 into float."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "test.parquet"
+            pq.write_table(pa.table({"col1": pa.array([1, None], type=pa.int64())}), test_file)
+
+            table = read_focus_table(test_file)
+            assert table.schema.field("col1").type == pa.int64()
+
+    def test_read_csv_table_matches_read_focus_file(self) -> None:
+        """Test CSV tables convert to the same frame read_focus_file returns."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "test.csv"
+            test_file.write_text("col1,col2\n1,2024-01-01T00:00:00Z\n2,\n")
+
+            table = read_focus_table(test_file)
+            pd.testing.assert_frame_equal(table.to_pandas(), read_focus_file(test_file))
+
+    def test_write_table_parquet_and_csv_gzip(self) -> None:
+        """Test tables are written as parquet directly and as CSV via pandas."""
+        import pyarrow as pa
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            table = pa.table({"col1": [1, 2], "col2": ["a", "b"]})
+            parquet_file = Path(tmpdir) / "subdir" / "output.parquet"
+            csv_file = Path(tmpdir) / "output.csv.gz"
+
+            write_focus_table(table, parquet_file, FileFormat.PARQUET)
+            write_focus_table(table, csv_file, FileFormat.CSV_GZIP)
+
+            assert read_focus_table(parquet_file).equals(table)
+            assert pd.read_csv(csv_file).shape == (2, 2)
+
+
+class TestStreamingIO:
+    """Test batched reading and writing of FOCUS files."""
+
+    def test_read_parquet_batches(self) -> None:
+        """Test a parquet file is yielded in batches of the requested size."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "test.parquet"
+            pd.DataFrame({"col1": range(10)}).to_parquet(test_file, index=False)
+
+            batches = list(read_focus_file_batches(test_file, batch_size=4))
+            assert [len(b) for b in batches] == [4, 4, 2]
+            assert pd.concat(batches)["col1"].tolist() == list(range(10))
+
+    def test_read_csv_gz_batches(self) -> None:
+        """Test a CSV.GZ file is yielded in batches of the requested size."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "test.csv.gz"
+            pd.DataFrame({"col1": range(10)}).to_csv(test_file, index=False, compression="gzip")
+
+            batches = list(read_focus_file_batches(test_file, batch_size=4))
+            assert [len(b) for b in batches] == [4, 4, 2]
+
+    @pytest.mark.parametrize("block_size", [None, 64])
+    def test_csv_batches_with_null_first_chunk_write_to_parquet(
+        self, block_size: int | None, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a column that is empty in the first batch keeps one type across batches."""
+        if block_size is not None:
+            # The schema probe then only sees rows where Tags is still empty
+            monkeypatch.setattr("focus_scrub.io._CSV_BLOCK_SIZE", block_size)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "test.csv"
+            rows = [f"{i},{'' if i < 5 else 'x'}" for i in range(10)]
+            test_file.write_text("Id,Tags\n" + "\n".join(rows) + "\n")
+            output_file = Path(tmpdir) / "output.parquet"
+
+            batches = list(read_focus_file_batches(test_file, batch_size=5))
+            write_focus_file_batches(batches, output_file, FileFormat.PARQUET)
+
+            assert [len(b) for b in batches] == [5, 5]
+            assert batches[0]["Tags"].isna().all()
+            written = pd.read_parquet(output_file)
+            assert pd.isna(written["Tags"][4])
+            assert written["Tags"][5] == "x"
+            assert written["Id"].tolist() == list(range(10))
+
+    def test_read_csv_batches_rejects_late_type_change(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a type change after the schema probe raises a clear error mid-stream."""
+        monkeypatch.setattr("focus_scrub.io._CSV_BLOCK_SIZE", 64)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "test.csv"
+            rows = "\n".join(str(i) for i in range(100))
+            test_file.write_text(f"col1\n{rows}\nnot-a-number\n")
+
+            with pytest.raises(ValueError, match="without --stream"):
+                list(read_focus_file_batches(test_file, batch_size=10))
+
+    @pytest.mark.parametrize(
+        ("output_format", "name"),
+        [(FileFormat.PARQUET, "output.parquet"), (FileFormat.CSV_GZIP, "output.csv.gz")],
+    )
+    def test_write_batches_failure_leaves_no_output(
+        self, output_format: FileFormat, name: str
+    ) -> None:
+        """Test a batch failing mid-write neither creates nor truncates the output file."""
+
+        def batches() -> Iterator[pd.DataFrame]:
+            yield pd.DataFrame({"col1": [1, 2]})
+            raise ValueError("bad batch")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_file = Path(tmpdir) / name
+
+            with pytest.raises(ValueError, match="bad batch"):
+                write_focus_file_batches(batches(), output_file, output_format)
+            assert list(Path(tmpdir).iterdir()) == []
+
+            output_file.write_bytes(b"previous run")
+            with pytest.raises(ValueError, match="bad batch"):
+                write_focus_file_batches(batches(), output_file, output_format)
+            assert list(Path(tmpdir).iterdir()) == [output_file]
+            assert output_file.read_bytes() == b"previous run"
+
+    def test_read_empty_parquet_yields_schema(self) -> None:
+        """Test an empty parquet file still yields one empty frame with its columns."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "test.parquet"
+            pd.DataFrame({"col1": pd.Series([], dtype="int64")}).to_parquet(test_file, index=False)
+
+            batches = list(read_focus_file_batches(test_file))
+            assert len(batches) == 1
+            assert list(batches[0].columns) == ["col1"]
+            assert batches[0].empty
+
+    def test_read_batches_unsupported_file_raises_error(self) -> None:
+        """Test batched reading of an unsupported file raises ValueError."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "test.txt"
+            test_file.write_text("not supported")
+
+            with pytest.raises(ValueError, match="Unsupported input format"):
+                list(read_focus_file_batches(test_file))
+
+    def test_write_parquet_batches(self) -> None:
+        """Test batches are written to one parquet file with one row group each."""
+        import pyarrow.parquet as pq
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_file = Path(tmpdir) / "subdir" / "output.parquet"
+            batches = [pd.DataFrame({"col1": [1, 2]}), pd.DataFrame({"col1": [3]})]
+
+            write_focus_file_batches(batches, output_file, FileFormat.PARQUET)
+
+            assert pd.read_parquet(output_file)["col1"].tolist() == [1, 2, 3]
+            assert pq.ParquetFile(output_file).num_row_groups == 2
+
+    def test_write_parquet_batches_cast_to_first_schema(self) -> None:
+        """Test later batches are cast to the first batch's schema, null columns as strings."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_file = Path(tmpdir) / "output.parquet"
+            batches = [
+                pd.DataFrame({"Tags": [None, None], "Qty": [1, 2]}, dtype=object).astype(
+                    {"Qty": "int64"}
+                ),
+                pd.DataFrame({"Tags": ["x", None], "Qty": [3.0, float("nan")]}),
+            ]
+
+            write_focus_file_batches(batches, output_file, FileFormat.PARQUET)
+
+            written = pd.read_parquet(output_file)
+            assert written["Tags"].tolist()[2] == "x"
+            assert written["Qty"].tolist()[:3] == [1, 2, 3]
+            assert pd.isna(written["Qty"].tolist()[3])
+
+    def test_write_csv_gzip_batches(self) -> None:
+        """Test batches are appended to one CSV.GZ file with a single header."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_file = Path(tmpdir) / "output.csv.gz"
+            batches = [pd.DataFrame({"col1": [1, 2]}), pd.DataFrame({"col1": [3]})]
+
+            write_focus_file_batches(batches, output_file, FileFormat.CSV_GZIP)
+
+            assert pd.read_csv(output_file)["col1"].tolist() == [1, 2, 3]
+
+    def test_write_sql_batches_raises_error(self) -> None:
+        """Test streaming SQL output is rejected."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_file = Path(tmpdir) / "output.sql"
+
+            with pytest.raises(ValueError, match="Streaming is not supported"):
+                write_focus_file_batches([pd.DataFrame()], output_file, FileFormat.SQL)
+
+    def test_write_parquet_batches_with_options(self) -> None:
+        """Test streaming parquet output honours compression and row group size."""
+        import pyarrow.parquet as pq
+        from focus_scrub.formats import ParquetOptions
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_file = Path(tmpdir) / "output.parquet"
+            batches = [pd.DataFrame({"col1": range(5)}), pd.DataFrame({"col1": range(5)})]
+
+            write_focus_file_batches(
+                batches,
+                output_file,
+                FileFormat.PARQUET,
+                parquet_options=ParquetOptions(compression="none", row_group_size=3),
+            )
+
+            metadata = pq.ParquetFile(output_file).metadata
+            assert metadata.num_rows == 10
+            assert metadata.num_row_groups == 4
+            assert metadata.row_group(0).column(0).compression == "UNCOMPRESSED"
+
 
 class TestSqlOutput:
     """Test SQL output format."""
@@ -17,7 +17,7 @@ class TestMappingCollector:
         mappings = collector.to_dict()
         assert "TestColumn" in mappings
         assert len(mappings["TestColumn"]) == 1
-        assert mappings["TestColumn"][0] == ("original", "replacement")
+        assert mappings["TestColumn"] == {"original": "replacement"}
 
     def test_record_multiple_mappings(self) -> None:
         """Test recording multiple mappings for same column."""
@@ -41,6 +41,37 @@ class TestMappingCollector:
         mappings = collector.to_dict()
         assert len(mappings["TestColumn"]) == 1
 
+    def test_record_many(self) -> None:
+        """Test bulk recording dedupes like record and keeps the first replacement."""
+        collector = MappingCollector()
+        collector.record("TestColumn", "value1", "mapped1")
+
+        collector.record_many(
+            "TestColumn", [("value1", "other"), ("value2", "mapped2"), ("value2", "other")]
+        )
+
+        assert collector.to_dict() == {"TestColumn": {"value1": "mapped1", "value2": "mapped2"}}
+
+    def test_first_replacement_wins(self) -> None:
+        """Test that a later replacement does not overwrite the first one recorded."""
+        collector = MappingCollector()
+
+        collector.record("TestColumn", "value1", "mapped1")
+        collector.record("TestColumn", "value1", "other")
+
+        assert collector.to_dict() == {"TestColumn": {"value1": "mapped1"}}
+
+    def test_to_dict_does_not_copy(self) -> None:
+        """Test that to_dict returns the recorded mappings without copying them."""
+        collector = MappingCollector()
+        collector.record("TestColumn", "value1", "mapped1")
+
+        mappings = collector.to_dict()
+        collector.record("TestColumn", "value2", "mapped2")
+
+        assert mappings is collector.to_dict()
+        assert mappings == {"TestColumn": {"value1": "mapped1", "value2": "mapped2"}}
+
     def test_multiple_columns(self) -> None:
         """Test recording mappings for multiple columns."""
         collector = MappingCollector()
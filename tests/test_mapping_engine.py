@@ -7,6 +7,11 @@ import re
 from focus_scrub.mapping import MappingEngine
 
 
+UUID_PATTERN = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE
+)
+
+
 class TestMappingEngine:
     """Test the central mapping engine."""
 
@@ -44,10 +49,7 @@ class TestMappingEngine:
         assert result1 == result2
         assert result1 != uuid
         # Verify it's a valid UUID format
-        uuid_pattern = re.compile(
-            r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE
-        )
-        assert uuid_pattern.match(result1)
+        assert UUID_PATTERN.match(result1)
 
     def test_name_mapping_consistency(self, mapping_engine: MappingEngine) -> None:
         """Test that the same name always maps to the same value."""
@@ -83,6 +85,15 @@ class TestMappingEngine:
         # Should preserve structure
         assert len(result1.split("-")) == len(code.split("-"))
 
+    def test_scramble_consistency(self, mapping_engine: MappingEngine) -> None:
+        """Test that scrambling maps each character consistently within its class."""
+        result = mapping_engine.scramble("Ab9-Ab9/xY")
+
+        assert result[:3] == result[4:7]
+        assert result[3] == "-" and result[7] == "/"
+        assert result[0].isupper() and result[1].islower() and result[2].isdigit()
+        assert mapping_engine.scramble("xY") == result[8:]
+
     def test_get_all_mappings(self, mapping_engine: MappingEngine) -> None:
         """Test that get_all_mappings returns all mapping types."""
         # Create some mappings
@@ -136,3 +147,16 @@ class TestMappingEngine:
         new_result = mapping_engine.map_number_id("555555555555")
         assert new_result != "555555555555"
         assert len(new_result) == 12
+
+    def test_load_bulk_adopts_dicts_into_empty_engine(self, mapping_engine: MappingEngine) -> None:
+        """Test load_bulk uses loaded dicts directly and merges into existing ones."""
+        existing = mapping_engine.map_name("Existing Co")
+        number_ids = {"111111111111": "999999999999"}
+
+        mapping_engine.load_bulk({"NumberId": number_ids, "Name": {"Test Company": "Nova Pi"}})
+
+        assert mapping_engine.get_all_mappings()["NumberId"] == number_ids
+        assert mapping_engine._number_id_map is number_ids
+        assert mapping_engine.map_number_id("111111111111") == "999999999999"
+        assert mapping_engine.map_name("Test Company") == "Nova Pi"
+        assert mapping_engine.map_name("Existing Co") == existing
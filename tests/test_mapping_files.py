@@ -0,0 +1,62 @@
+"""Tests for reading and writing mapping files."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+from focus_scrub.mapping import check_mappings_path, read_mappings_file, write_mappings_file
+
+
+EXPORT_DATA = {
+    "column_mappings": {"BillingAccountId": {"123456789012": "987654321098"}},
+    "component_mappings": {"NumberId": {"123456789012": "987654321098"}, "Name": {"Café": "Vega"}},
+}
+
+
+class TestMappingFiles:
+    """Test mapping file round trips with and without orjson."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trip(self, use_orjson: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test written mapping files load back unchanged."""
+        if not use_orjson:
+            monkeypatch.setattr("focus_scrub.mapping.files.orjson", None)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "mappings.json"
+            write_mappings_file(path, EXPORT_DATA)
+
+            assert read_mappings_file(path) == EXPORT_DATA
+            # Output stays indented JSON readable by the standard library
+            assert json.loads(path.read_text(encoding="utf-8")) == EXPORT_DATA
+            assert '\n  "column_mappings"' in path.read_text(encoding="utf-8")
+
+    def test_non_str_keys_are_stringified(self) -> None:
+        """Test non-string keys are written as strings, like json.dump does."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "mappings.json"
+            write_mappings_file(path, {"column_mappings": {"Col": {123: "456"}}})
+
+            assert read_mappings_file(path) == {"column_mappings": {"Col": {"123": "456"}}}
+
+    def test_msgpack_round_trip(self) -> None:
+        """Test a .msgpack suffix writes and reads msgpack instead of JSON."""
+        msgpack = pytest.importorskip("msgpack")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "mappings.msgpack"
+            write_mappings_file(path, EXPORT_DATA)
+
+            assert msgpack.unpackb(path.read_bytes(), raw=False) == EXPORT_DATA
+            assert read_mappings_file(path) == EXPORT_DATA
+
+    def test_msgpack_requires_package(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a .msgpack path is rejected when msgpack is not installed."""
+        monkeypatch.setattr("focus_scrub.mapping.files.msgpack", None)
+
+        check_mappings_path(Path("mappings.json"))
+        with pytest.raises(ValueError, match="require the optional msgpack package"):
+            check_mappings_path(Path("mappings.msgpack"))
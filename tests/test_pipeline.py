@@ -0,0 +1,106 @@
+"""Tests for the read -> scrub -> write pipeline."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from focus_scrub.pipeline import run_pipeline
+
+
+class TestRunPipeline:
+    """Test pipelined file processing."""
+
+    def test_yields_results_in_input_order(self) -> None:
+        """Test every file is read, scrubbed and written, in input order."""
+        files = [Path(f"file{i}.csv") for i in range(5)]
+        written: dict[Path, pd.DataFrame] = {}
+
+        def read(path: Path) -> pd.DataFrame:
+            return pd.DataFrame({"name": [path.stem]})
+
+        def scrub(df: pd.DataFrame) -> pd.DataFrame:
+            return df.assign(name=df["name"].str.upper())
+
+        def write(path: Path, df: pd.DataFrame) -> Path:
+            written[path] = df
+            return path.with_suffix(".parquet")
+
+        results = list(run_pipeline(files, read=read, scrub=scrub, write=write))
+
+        assert results == [(f, f.with_suffix(".parquet")) for f in files]
+        assert [written[f]["name"].iloc[0] for f in files] == [f"FILE{i}" for i in range(5)]
+
+    def test_concurrent_writers_keep_input_order(self) -> None:
+        """Test results are reported in input order even when writes finish out of order."""
+        files = [Path(f"file{i}.csv") for i in range(8)]
+        write_threads: set[int] = set()
+
+        def write(path: Path, df: pd.DataFrame) -> Path:
+            write_threads.add(threading.get_ident())
+            time.sleep(random.uniform(0, 0.01))
+            return path
+
+        results = list(
+            run_pipeline(
+                files,
+                read=lambda path: pd.DataFrame(),
+                scrub=lambda df: df,
+                write=write,
+                writers=3,
+            )
+        )
+
+        assert [path for path, _ in results] == files
+        assert 1 <= len(write_threads) <= 3
+
+    def test_scrub_runs_on_single_thread(self) -> None:
+        """Test the scrub stage never runs concurrently with itself."""
+        files = [Path(f"file{i}.csv") for i in range(10)]
+        scrub_threads: set[int] = set()
+
+        def scrub(df: pd.DataFrame) -> pd.DataFrame:
+            scrub_threads.add(threading.get_ident())
+            return df
+
+        list(
+            run_pipeline(
+                files,
+                read=lambda path: pd.DataFrame(),
+                scrub=scrub,
+                write=lambda path, df: path,
+            )
+        )
+
+        assert len(scrub_threads) == 1
+
+    def test_stage_error_is_raised(self) -> None:
+        """Test an exception in any stage is re-raised after the pipeline drains."""
+        files = [Path(f"file{i}.csv") for i in range(5)]
+
+        def read(path: Path) -> pd.DataFrame:
+            if path.stem == "file2":
+                raise ValueError("bad file")
+            return pd.DataFrame()
+
+        results = []
+        with pytest.raises(ValueError, match="bad file"):
+            for result in run_pipeline(
+                files, read=read, scrub=lambda df: df, write=lambda path, df: path
+            ):
+                results.append(result)
+
+        # Files before the failure are still reported; nothing after it
+        assert [path for path, _ in results] == files[: len(results)]
+        assert len(results) <= 2
+
+    def test_empty_input(self) -> None:
+        """Test an empty file list produces no results."""
+        results = run_pipeline(
+            [], read=lambda path: pd.DataFrame(), scrub=lambda df: df, write=lambda p, df: p
+        )
+        assert list(results) == []